@@ -13,7 +13,7 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(current_dir)
 sys.path.append(project_root)
 
-from utils.config import check_config_parameters
+from utils.config import check_config_parameters, resolve_endpoint
 
 logger = logging.getLogger(__name__)
 
@@ -36,7 +36,8 @@ class DataManager:
         
         api_key = config.get('BINANCE_API_KEY')
         api_secret = config.get('BINANCE_API_SECRET')
-        base_url = config.get('base_endpoint')
+        # 配置了多個端點時，選擇延遲最低的一個
+        base_url = resolve_endpoint(config.get('base_endpoint'))
         
         if not api_key or not api_secret:
             raise ValueError("未找到 Binance API 金鑰配置")
@@ -230,9 +230,9 @@ class PositionManager:
                 
             # 更新持倉交易對列表
             self.account_info['positions'] = [
-                position['symbol'] 
+                position.symbol 
                 for position in account_info.positions 
-                if float(position.get('position_amt', 0)) != 0
+                if position.position_amt != 0
             ]
             
             logger.info("帳戶信息更新成功")
@@ -757,9 +757,9 @@ class PositionManager:
                 logger.warning(f"無法獲取 {symbol} 的訂單簿")
                 return False
                 
-            # 計算滑價比率
-            best_bid = Decimal(str(orderbook['bids'][0][0]))
-            best_ask = Decimal(str(orderbook['asks'][0][0]))
+            # 計算滑價比率（訂單簿價格本身即為字串，直接構造 Decimal）
+            best_bid = Decimal(orderbook['bids'][0][0])
+            best_ask = Decimal(orderbook['asks'][0][0])
             mid_price = (best_bid + best_ask) / 2
             
             # 計算滑價比率
@@ -1,6 +1,6 @@
-from .binance_api import BinanceAPI
+from .binance_api import BinanceAPI, BatchOrderError
 from .order_executor import OrderExecutor
-from .converter import BinanceConverter
+from .converter import BinanceConverter, LazyOrders
 from .enums import (
     OrderSide,
     OrderType,
@@ -14,7 +14,10 @@ from .data_models import (
     OrderResult,
     PositionInfo,
     Order,
-    AccountInfo
+    AccountInfo,
+    AssetInfo,
+    AccountPosition,
+    SymbolConstraints
 )
 
 # 統一設置日誌
@@ -22,8 +25,10 @@ import logging
 
 __all__ = [
     'BinanceAPI',
+    'BatchOrderError',
     'OrderExecutor',
     'BinanceConverter',
+    'LazyOrders',
     'OrderSide',
     'OrderType',
     'OrderStatus',
@@ -34,7 +39,10 @@ __all__ = [
     'OrderResult',
     'PositionInfo',
     'Order',
-    'AccountInfo'
+    'AccountInfo',
+    'AssetInfo',
+    'AccountPosition',
+    'SymbolConstraints'
 ]
 
 # 設置日誌格式
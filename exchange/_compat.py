@@ -0,0 +1,4 @@
+import sys
+
+# dataclass(slots=True) 需要 Python 3.10+，較舊版本退回普通 dataclass
+SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
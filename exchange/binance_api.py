@@ -1,28 +1,100 @@
 from binance.um_futures import UMFutures
 from binance.error import ClientError
+from requests.adapters import HTTPAdapter
 import pandas as pd
-from typing import Optional, Union, List, Callable, Dict, Tuple, Any
+from typing import Optional, Union, List, Callable, Dict, Tuple, Any, Sequence
 import logging
 from datetime import datetime
 import os
 import yaml
 import json
 import time
+import random
 from decimal import Decimal
 from dotenv import load_dotenv
 import threading
+import queue
+import logging.handlers
 import websocket
 import ssl
+import asyncio
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor, Future, as_completed
+from itertools import chain
+from collections import defaultdict
 
 from .enums import OrderSide, PositionStatus, CloseReason, OrderType, OrderStatus, WorkingType, TimeInForce, PriceMatch, SelfTradePreventionMode, PositionSide
-from .data_models import PositionInfo, AccountInfo, Order, OrderResult
-from .converter import BinanceConverter
-from utils.config import check_config_parameters
+from .data_models import PositionInfo, AccountInfo, Order, OrderResult, SymbolConstraints
+from .converter import BinanceConverter, LazyOrders
+from .validators import validate_order_params
+from utils.config import check_config_parameters, resolve_endpoint
+
+# 優先使用 orjson 解析 JSON（可直接處理 bytes，速度約為標準庫數倍），未安裝時退回 json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+_json_loads = orjson.loads if orjson else json.loads
+
+def _orjson_response_hook(response, *args, **kwargs):
+    """requests 響應鉤子：讓 response.json() 改以 orjson 直接解析原始 bytes"""
+    response.json = lambda **_: orjson.loads(response.content)
+    return response
 
 # 設置日誌
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 未完成（可取消）的訂單狀態
+_OPEN_ORDER_STATUSES = frozenset({'NEW', 'PARTIALLY_FILLED'})
+
+# 批量下單每批最多包含的訂單數（幣安限制）
+_BATCH_ORDER_LIMIT = 5
+
+
+class BatchOrderError(ClientError):
+    """批量下單中單筆訂單被拒絕
+    
+    整個請求本身成功，失敗的只是其中一項，因此沒有對應的 HTTP 狀態碼（status_code 為 None）；
+    error_code 與 error_message 為幣安返回的該項錯誤碼及信息
+    """
+    
+    def __init__(self, error_code: Optional[int], error_message: Optional[str]):
+        super().__init__(None, error_code, error_message, {})
+        
+    def __str__(self) -> str:
+        return f"({self.error_code}, {self.error_message!r})"
+
+
+# WebSocket 建立連接的超時時間（秒），與心跳的 pong_timeout 無關
+_WS_CONNECT_TIMEOUT = 10
+
+# Binance 返回的零數量字串，常見格式可直接比對，無需解析
+_ZERO_AMOUNTS = frozenset({'0', '0.0', '0.00', '0.000', '0.0000', '0.00000', '0.000000', '0.0000000', '0.00000000'})
+
+# 不會再變化的訂單狀態
+_FINAL_ORDER_STATUSES = frozenset({
+    OrderStatus.FILLED,
+    OrderStatus.CANCELED,
+    OrderStatus.REJECTED,
+    OrderStatus.EXPIRED,
+})
+
+# 交易規則解析表 {規則類型: (過濾器類型, 缺失時的錯誤描述, 解析函數)}
+_FILTER_RULES = {
+    'lot_size': ('LOT_SIZE', '數量限制', lambda f: {
+        'min_qty': Decimal(f['minQty']),
+        'max_qty': Decimal(f['maxQty']),
+        'step_size': Decimal(f['stepSize'])
+    }),
+    'price_filter': ('PRICE_FILTER', '價格限制', lambda f: {
+        'min_price': Decimal(f['minPrice']),
+        'max_price': Decimal(f['maxPrice']),
+        'tick_size': Decimal(f['tickSize'])
+    }),
+    'min_notional': ('MIN_NOTIONAL', '最小名義價值要求', lambda f: Decimal(f['notional'])),
+}
+
 class BinanceAPI:
     """Binance API 封裝類"""
     
@@ -60,49 +132,156 @@ class BinanceAPI:
             self.api_key = config_params['BINANCE_TESTNET_API_KEY'] if config_params['testnet'] else config_params['BINANCE_API_KEY']
             self.api_secret = config_params['BINANCE_TESTNET_API_SECRET'] if config_params['testnet'] else config_params['BINANCE_API_SECRET']
             self.ws_base_url = config_params['webSocket_base_endpoint_for_testnet'] if config_params['testnet'] else config_params['webSocket_base_endpoint']
+            # 用戶數據流 URL 前綴，連接時只需拼接 listenKey
+            self._ws_url_prefix = self._normalize_ws_base(self.ws_base_url) + '/ws/'
             
             # 設置 WebSocket 配置
             self.websocket_ping_interval = config_params['ping_interval']
             self.websocket_ping_timeout = config_params['pong_timeout']
             self.websocket_reconnect_attempts = config_params['reconnect_attempts']
+            if self.websocket_ping_timeout >= self.websocket_ping_interval:
+                raise ValueError(
+                    f"pong_timeout ({self.websocket_ping_timeout}) 必須小於 ping_interval ({self.websocket_ping_interval})"
+                )
+            # 模組級別的全局設定，只需在初始化時設置一次；
+            # pong_timeout 由 run_forever 處理，不能作為連接超時
+            websocket.setdefaulttimeout(_WS_CONNECT_TIMEOUT)
             
             # 設置交易參數
             self.symbol_list = config_params['symbol_list']
+            self._symbol_set = frozenset(self.symbol_list)
+            
+            # 交易所信息緩存，刷新時同時建立交易對及過濾器索引
+            self._exchange_info = None
+            self._exchange_info_time = 0.0
+            self._exchange_info_ttl = 3600  # 緩存有效期（秒）
+            self._exchange_info_lock = threading.Lock()
+            self._symbol_index = {}  # {symbol: symbol_info}
+            self._filters_index = {}  # {symbol: {filterType: filter}}
+            
+            # 交易規則緩存 {(規則類型, symbol): 解析結果}，各規則首次查詢時獨立解析，隨交易所信息一併清空
+            self._filter_values = {}
+            
+            # 訂單狀態緩存 {(symbol, order_id 或 client_order_id): (緩存時間, OrderResult, 是否由數據流保證有效)}
+            # WebSocket 連接期間，訂單的任何變化都會推送 ORDER_TRADE_UPDATE 並清除對應緩存，
+            # 因此查詢後沒有收到推送的緩存可一直使用，斷線時退回按有效期判斷
+            self._order_status_cache = {}
+            self._order_event_seq = 0  # 收到的 ORDER_TRADE_UPDATE 數量，用於判斷查詢期間是否有推送
+            self._order_status_cache_lock = threading.RLock()
+            self._order_status_ttl = 2  # 未完成訂單的緩存有效期（秒），已完成訂單不過期
+            
+            # 最新價格緩存 {symbol: (緩存時間, ticker)}，同一決策週期內的重複查詢只發一次請求
+            self._ticker_cache = {}
+            self._ticker_cache_lock = threading.Lock()
+            self._ticker_ttl = 0.25  # 緩存有效期（秒）
+            
+            # 微批次下單
+            self.enable_batch = False
+            self.batch_window = 0.005  # 批次累積時間（秒）
+            self._pending_orders = []
+            # 下單線程與批次發送線程共用的條件變量，有新訂單或需要停止時通知發送線程
+            self._pending_orders_cond = threading.Condition(threading.Lock())
+            self._batch_deadline = 0.0  # 當前批次的發送時間（monotonic）
+            self._batch_thread = None
+            self._batch_stop = False
             self.leverage = config_params['leverage']
 
             # 初始化 REST API 客戶端
             base_url = config_params['testnet_rest_api_url'] if config_params['testnet'] else config_params['base_endpoint']
+            # 配置了多個端點時，選擇延遲最低的一個
+            base_url = resolve_endpoint(base_url)
             self.client = UMFutures(
                 key=self.api_key,
                 secret=self.api_secret,
                 base_url=base_url
             )
-            self.client.timeout = config_params['recv_window']
+            # recv_window 為簽名請求的有效時間窗口（毫秒），每次請求時作為 recvWindow 參數傳入；
+            # HTTP 請求超時（秒）另行設置
+            self.recv_window = config_params['recv_window']
+            self.client.timeout = 10
+            
+            # 擴大連接池，讓並發請求共用 keep-alive 連接，避免重複 TCP/TLS 握手
+            adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=0)
+            self.client.session.mount('https://', adapter)
+            self.client.session.mount('http://', adapter)
+            
+            # 連接器以 response.json() 解析響應，安裝 orjson 時替換為更快的解析器
+            if orjson:
+                self.client.session.hooks['response'].append(_orjson_response_hook)
             
             # 初始化 WebSocket 相關屬性
             self.order_callback = None
-            self._keepalive_running = False
+            self._keepalive_stop = threading.Event()
             self._keepalive_thread = None
             self.ws_client = None
             self.listen_key = None
             self._reconnecting = False
             self._listen_key_attempts = 0
             self._reconnect_attempts = 0
+            self._ws_connected = threading.Event()
+            self._ws_callbacks = {}
+            self._ws_stop = threading.Event()  # 主動停止監聽時設置，用於中斷重連等待
+            
+            # 用戶數據流消息隊列，由單一工作線程處理，避免回調阻塞 WebSocket 讀取線程
+            self._msg_queue = queue.Queue(maxsize=4096)
+            self._msg_batch_size = 128  # 每次最多取出的消息數
+            self._msg_worker = None
+            self._log_queue = None
+            self._log_handler = None
+            self._log_listener = None
+            
+            # 用戶數據流事件分派表 {事件類型: 處理方法}
+            self._event_dispatch = {
+                'ACCOUNT_UPDATE': self._on_account_update,
+                'ORDER_TRADE_UPDATE': self._on_order_trade_update,
+                'TRADE_LITE': self._on_trade_lite,
+                'MARGIN_CALL': self._on_margin_call,
+                'ACCOUNT_CONFIG_UPDATE': self._on_account_config_update,
+            }
             
             # 啟用 WebSocket 調試日誌
             websocket.enableTrace(config_params['debug'])
             websocket_logger = logging.getLogger('websocket')
             websocket_logger.setLevel(logging.DEBUG if config_params['debug'] else logging.WARNING)
             
-            logger.info(f"已初始化 Binance API（{'測試網' if config_params['testnet'] else '主網'}）")
-            logger.info(f"WebSocket 基礎 URL: {self.ws_base_url}")
-            logger.info(f"WebSocket 配置: ping_interval={self.websocket_ping_interval}, ping_timeout={self.websocket_ping_timeout}")
-            logger.info(f"交易對列表: {self.symbol_list}")
+            logger.info("已初始化 Binance API（%s）", '測試網' if config_params['testnet'] else '主網')
+            logger.info("WebSocket 基礎 URL: %s", self.ws_base_url)
+            logger.info("WebSocket 配置: ping_interval=%s, ping_timeout=%s", self.websocket_ping_interval, self.websocket_ping_timeout)
+            logger.info("交易對列表: %s", self.symbol_list)
             
         except Exception as e:
-            logger.error(f"初始化 Binance API 失敗: {str(e)}")
+            logger.error("初始化 Binance API 失敗: %s", e)
             raise
             
+    @property
+    def symbol_set(self) -> frozenset:
+        """已配置交易對的集合，用於 O(1) 成員判斷"""
+        return self._symbol_set
+
+    @staticmethod
+    def _normalize_ws_base(ws_base_url: str) -> str:
+        """標準化 WebSocket 基礎 URL，確保以 wss:// 開頭且不以 /ws 結尾
+        
+        Args:
+            ws_base_url: 配置中的 WebSocket 基礎 URL
+            
+        Returns:
+            str: 標準化後的基礎 URL
+        """
+        ws_url = ws_base_url.rstrip('/')
+        if ws_url.endswith('/ws'):
+            ws_url = ws_url[:-len('/ws')]
+        if ws_url.startswith('wss://'):
+            return ws_url
+        for prefix in ('ws://', 'https://', 'http://'):
+            if ws_url.startswith(prefix):
+                ws_url = ws_url[len(prefix):]
+                break
+        else:
+            if '://' in ws_url:
+                raise ValueError(f"不支持的 WebSocket URL 協議: {ws_base_url}")
+        return 'wss://' + ws_url
+
     def _get_listen_key(self) -> str:
         """獲取 listenKey"""
         try:
@@ -111,7 +290,7 @@ class BinanceAPI:
                 return response['listenKey']
             return response
         except Exception as e:
-            logger.error(f"獲取 listenKey 失敗: {str(e)}")
+            logger.error("獲取 listenKey 失敗: %s", e)
             raise
 
     def _extend_listen_key(self) -> None:
@@ -124,31 +303,61 @@ class BinanceAPI:
             self.client.renew_listen_key(listenKey=self.listen_key)
             logger.info("已延長 listenKey 的有效期")
         except Exception as e:
-            logger.error(f"延長 listenKey 有效期失敗: {str(e)}")
+            logger.error("延長 listenKey 有效期失敗: %s", e)
             # 如果延長失敗，嘗試重新獲取
             try:
                 self.listen_key = self._get_listen_key()
                 logger.info("已重新獲取 listenKey")
             except Exception as e2:
-                logger.error(f"重新獲取 listenKey 失敗: {str(e2)}")
+                logger.error("重新獲取 listenKey 失敗: %s", e2)
                 raise
 
     def _start_listen_key_keepalive(self) -> None:
         """啟動定期更新 listenKey 的後台任務"""
         def keepalive():
-            while self._keepalive_running:
+            # 以 Event 等待代替 sleep，停止時可立即喚醒退出
+            while not self._keepalive_stop.is_set():
                 try:
                     self._extend_listen_key()
-                    time.sleep(30 * 60)  # 每30分鐘更新一次
+                    self._keepalive_stop.wait(30 * 60)  # 每30分鐘更新一次
                 except Exception as e:
-                    logger.error(f"更新 listenKey 失敗: {str(e)}")
-                    time.sleep(60)  # 失敗後等待1分鐘再重試
+                    logger.error("更新 listenKey 失敗: %s", e)
+                    self._keepalive_stop.wait(60)  # 失敗後等待1分鐘再重試
 
-        self._keepalive_running = True
+        self._keepalive_stop.clear()
         self._keepalive_thread = threading.Thread(target=keepalive, daemon=True)
         self._keepalive_thread.start()
         logger.info("已啟動 listenKey 保活任務")
 
+    def _start_log_listener(self) -> None:
+        """將本模組的日誌改經由隊列交給背景線程輸出，避免 WebSocket 線程執行格式化與 I/O"""
+        if self._log_listener:
+            return
+            
+        # 沿用根日誌器的處理器，保持與其他模組相同的輸出格式與目的地
+        handlers = logging.getLogger().handlers or [logging.StreamHandler()]
+        self._log_queue = queue.SimpleQueue()
+        self._log_handler = logging.handlers.QueueHandler(self._log_queue)
+        self._log_listener = logging.handlers.QueueListener(
+            self._log_queue, *handlers, respect_handler_level=True
+        )
+        self._log_listener.start()
+        logger.addHandler(self._log_handler)
+        logger.propagate = False
+
+    def _stop_log_listener(self) -> None:
+        """停止背景日誌線程並恢復同步輸出"""
+        if not self._log_listener:
+            return
+            
+        logger.removeHandler(self._log_handler)
+        logger.propagate = True
+        # stop() 會先輸出隊列中剩餘的日誌
+        self._log_listener.stop()
+        self._log_listener = None
+        self._log_handler = None
+        self._log_queue = None
+
     def start_position_listener(self, order_callback: Callable[[Order], None]) -> None:
         """啟動倉位監聽器"""
         try:
@@ -162,34 +371,41 @@ class BinanceAPI:
                 raise ValueError("回調函數必須是可調用的")
                 
             self.order_callback = order_callback
+            self._ws_stop.clear()
+            
+            # 啟動背景日誌線程
+            self._start_log_listener()
             
             # 先獲取 listenKey
             try:
                 self.listen_key = self._get_listen_key()
                 if not self.listen_key:
                     raise ValueError("獲取 listenKey 失敗")
-                logger.info(f"成功獲取 listenKey: {self.listen_key}")
+                logger.info("成功獲取 listenKey: %s", self.listen_key)
             except Exception as e:
-                logger.error(f"獲取 listenKey 失敗: {str(e)}")
+                logger.error("獲取 listenKey 失敗: %s", e)
                 raise
             
             # 啟動 listenKey 保活任務
             self._start_listen_key_keepalive()
             
+            # 啟動消息處理線程
+            self._start_message_worker()
+            
             def on_message(ws, message):
-                try:
-                    msg = json.loads(message)
-                    self._handle_user_message(msg)
-                except json.JSONDecodeError as e:
-                    logger.error(f"解析 WebSocket 消息失敗: {str(e)}")
-                except Exception as e:
-                    logger.error(f"處理 WebSocket 消息時發生錯誤: {str(e)}")
+                self._enqueue_message(message)
             
             def on_error(ws, error):
-                logger.error(f"WebSocket 錯誤: {str(error)}")
+                logger.error("WebSocket 錯誤: %s", error)
             
             def on_close(ws, close_status_code, close_msg):
-                logger.warning(f"WebSocket 連接關閉: {close_status_code} - {close_msg}")
+                logger.warning("WebSocket 連接關閉: %s - %s", close_status_code, close_msg)
+                self._ws_connected.clear()
+                # 斷線期間可能遺漏訂單事件，緩存的訂單狀態不再可信
+                self._discard_order_status_cache()
+                if self._ws_stop.is_set():
+                    # 主動停止監聽，無需重連
+                    return
                 if self._reconnecting:
                     logger.warning("已經在重連過程中，忽略新的重連請求")
                     return
@@ -199,53 +415,61 @@ class BinanceAPI:
             
             def on_open(ws):
                 logger.info("WebSocket 連接已建立")
+                self._ws_connected.set()
+            
+            # 保存回調函數，重連時沿用
+            self._ws_callbacks = {
+                'on_message': on_message,
+                'on_error': on_error,
+                'on_close': on_close,
+                'on_open': on_open
+            }
             
-            # 構建 WebSocket URL，確保以 wss:// 開頭且不以 /ws 結尾
-            ws_url = self.ws_base_url.rstrip('/ws')
-            if not ws_url.startswith('wss://'):
-                ws_url = 'wss://' + ws_url.lstrip('ws://')
-            ws_url = f"{ws_url}/ws/{self.listen_key}"
+            # 構建 WebSocket URL
+            ws_url = self._ws_url_prefix + self.listen_key
             
-            logger.info(f"正在連接到 WebSocket: {ws_url}")
+            logger.info("正在連接到 WebSocket: %s", ws_url)
             
             # 創建 WebSocket 客戶端
-            self.ws_client = websocket.WebSocketApp(
-                ws_url,
-                on_message=on_message,
-                on_error=on_error,
-                on_close=on_close,
-                on_open=on_open
-            )
-            
-            # 設置 WebSocket 配置
-            websocket.setdefaulttimeout(self.websocket_ping_timeout)
+            self.ws_client = websocket.WebSocketApp(ws_url, **self._ws_callbacks)
             
             # 在單獨的線程中運行 WebSocket 客戶端
+            self._ws_connected.clear()
             self.ws_thread = threading.Thread(
                 target=self.ws_client.run_forever,
                 kwargs={
                     'ping_interval': self.websocket_ping_interval,
                     'ping_timeout': self.websocket_ping_timeout,
-                    'sslopt': {'cert_reqs': ssl.CERT_NONE}
+                    'sslopt': {'cert_reqs': ssl.CERT_NONE},
+                    # Binance 推送的均為合法 UTF-8 文本，跳過純 Python 實現的逐幀校驗
+                    'skip_utf8_validation': True
                 },
                 daemon=True
             )
             self.ws_thread.start()
             
-            # 等待連接建立
-            for _ in range(5):  # 最多等待 5 秒
-                if self.ws_client.sock and self.ws_client.sock.connected:
-                    logger.info("持倉監聽器啟動成功")
-                    return
-                time.sleep(1)
-            
-            raise ConnectionError("WebSocket 連接建立超時")
+            # 等待連接建立（最多等待 5 秒，on_open 觸發後立即返回）
+            if not self._ws_connected.wait(timeout=5.0):
+                raise ConnectionError("WebSocket 連接建立超時")
+            logger.info("持倉監聽器啟動成功")
             
         except Exception as e:
-            logger.error(f"啟動持倉監聽器失敗: {str(e)}")
+            logger.error("啟動持倉監聽器失敗: %s", e)
             self.stop_position_listener()
             raise
 
+    @staticmethod
+    def _get_backoff_time(attempts: int) -> float:
+        """計算重試等待時間（指數退避，上限 60 秒，並加入隨機抖動）
+        
+        Args:
+            attempts: 目前的重試次數
+            
+        Returns:
+            float: 等待秒數
+        """
+        return min(60, 2 ** min(attempts, 6)) + random.uniform(0, 1)
+
     def _reconnect_listen_key(self) -> bool:
         """重新獲取 listenKey
         
@@ -257,26 +481,27 @@ class BinanceAPI:
                 self._listen_key_attempts = 0
             
             self._listen_key_attempts += 1
-            logger.warning(f"嘗試重新獲取 ListenKey (第 {self._listen_key_attempts} 次)")
+            logger.warning("嘗試重新獲取 ListenKey (第 %s 次)", self._listen_key_attempts)
             
             # 等待一段時間再重試
-            wait_time = 2 ** self._listen_key_attempts  # 指數退避
-            logger.info(f"等待 {wait_time} 秒後重試...")
-            time.sleep(wait_time)
+            wait_time = self._get_backoff_time(self._listen_key_attempts)
+            logger.info("等待 %.2f 秒後重試...", wait_time)
+            if self._ws_stop.wait(wait_time):
+                return False
             
             # 嘗試獲取新的 listenKey
             try:
                 self.listen_key = self._get_listen_key()
                 if self.listen_key:
-                    logger.info(f"成功獲取新的 ListenKey: {self.listen_key}")
+                    logger.info("成功獲取新的 ListenKey: %s", self.listen_key)
                     self._listen_key_attempts = 0  # 重置重試計數器
                     return True
             except Exception as e:
-                logger.error(f"獲取 ListenKey 失敗: {str(e)}")
+                logger.error("獲取 ListenKey 失敗: %s", e)
                 return False
                 
         except Exception as e:
-            logger.error(f"重新獲取 ListenKey 過程中發生錯誤: {str(e)}")
+            logger.error("重新獲取 ListenKey 過程中發生錯誤: %s", e)
             return False
 
     def _reconnect_websocket(self):
@@ -289,15 +514,7 @@ class BinanceAPI:
                 return
                 
             self._reconnect_attempts += 1
-            logger.warning(f"嘗試重新連接 WebSocket (第 {self._reconnect_attempts} 次)")
-            
-            # 保存當前的回調函數
-            current_callbacks = {
-                'on_message': self.ws_client.on_message if self.ws_client else None,
-                'on_error': self.ws_client.on_error if self.ws_client else None,
-                'on_close': self.ws_client.on_close if self.ws_client else None,
-                'on_open': self.ws_client.on_open if self.ws_client else None
-            }
+            logger.warning("嘗試重新連接 WebSocket (第 %s 次)", self._reconnect_attempts)
             
             # 關閉現有連接
             if self.ws_client:
@@ -306,135 +523,187 @@ class BinanceAPI:
                 except:
                     pass
             
-            # 等待一段時間再重連
-            wait_time = 2 ** self._reconnect_attempts  # 指數退避
-            logger.info(f"等待 {wait_time} 秒後重試...")
-            time.sleep(wait_time)
+            # 等待一段時間再重連，期間主動停止監聽則立即放棄
+            wait_time = self._get_backoff_time(self._reconnect_attempts)
+            logger.info("等待 %.2f 秒後重試...", wait_time)
+            if self._ws_stop.wait(wait_time):
+                logger.info("重連：監聽器已停止，放棄重連")
+                self._reconnecting = False
+                return
             
             # 獲取新的 listenKey
             while not self._reconnect_listen_key():
+                if self._ws_stop.is_set():
+                    self._reconnecting = False
+                    return
                 logger.error("重連：無法獲取 ListenKey，將繼續重試")
                 if self._listen_key_attempts >= self.websocket_reconnect_attempts:
                     logger.error("ListenKey 重試次數已達上限，請檢查網絡連接或重啟程序")
                     return
             
             # 構建新的 WebSocket URL
-            ws_url = self.ws_base_url.rstrip('/ws')
-            if not ws_url.startswith('wss://'):
-                ws_url = 'wss://' + ws_url.lstrip('ws://')
-            ws_url = f"{ws_url}/ws/{self.listen_key}"
+            ws_url = self._ws_url_prefix + self.listen_key
             
-            logger.info(f"重連：正在連接到 WebSocket: {ws_url}")
+            logger.info("重連：正在連接到 WebSocket: %s", ws_url)
             
             # 重新創建 WebSocket 客戶端
-            self.ws_client = websocket.WebSocketApp(
-                ws_url,
-                on_message=current_callbacks['on_message'],
-                on_error=current_callbacks['on_error'],
-                on_close=current_callbacks['on_close'],
-                on_open=current_callbacks['on_open']
-            )
+            self.ws_client = websocket.WebSocketApp(ws_url, **self._ws_callbacks)
             
             # 在新線程中運行
+            self._ws_connected.clear()
             self.ws_thread = threading.Thread(
                 target=self.ws_client.run_forever,
                 kwargs={
                     'ping_interval': self.websocket_ping_interval,
                     'ping_timeout': self.websocket_ping_timeout,
-                    'sslopt': {'cert_reqs': ssl.CERT_NONE}
+                    'sslopt': {'cert_reqs': ssl.CERT_NONE},
+                    # Binance 推送的均為合法 UTF-8 文本，跳過純 Python 實現的逐幀校驗
+                    'skip_utf8_validation': True
                 },
                 daemon=True
             )
             self.ws_thread.start()
             
-            # 等待連接建立
-            for _ in range(5):  # 最多等待 5 秒
-                if self.ws_client.sock and self.ws_client.sock.connected:
-                    logger.info("重連：WebSocket 連接成功")
-                    self._reconnect_attempts = 0  # 重置重連計數器
-                    self._reconnecting = False # 重置重連狀態
-                    return
-                time.sleep(1)
+            # 等待連接建立（最多等待 5 秒，on_open 觸發後立即返回）
+            if self._ws_connected.wait(timeout=5.0):
+                logger.info("重連：WebSocket 連接成功")
+                self._reconnect_attempts = 0  # 重置重連計數器
+                self._reconnecting = False # 重置重連狀態
+                return
 
             self._reconnecting = False
             
             logger.error("重連：無法連接 WebSocket，將繼續重試")
             
         except Exception as e:
-            logger.error(f"重連：WebSocket 重連過程中發生錯誤: {str(e)}")
+            logger.error("重連：WebSocket 重連過程中發生錯誤: %s", e)
 
+    def _start_message_worker(self) -> None:
+        """啟動用戶數據流消息處理線程"""
+        if self._msg_worker and self._msg_worker.is_alive():
+            return
+            
+        self._msg_queue = queue.Queue(maxsize=4096)
+        self._msg_worker = threading.Thread(target=self._process_messages, daemon=True)
+        self._msg_worker.start()
+        
+    def _stop_message_worker(self) -> None:
+        """停止用戶數據流消息處理線程"""
+        if not self._msg_worker:
+            return
+            
+        try:
+            # 以 None 作為結束標記
+            self._msg_queue.put(None, timeout=1)
+        except queue.Full:
+            logger.warning("消息隊列已滿，無法通知消息處理線程停止")
+        self._msg_worker.join(timeout=5)
+        self._msg_worker = None
+        
+    def _process_messages(self) -> None:
+        """消息處理線程主循環，每次取出所有已到達的消息（最多 _msg_batch_size 條）後逐一處理"""
+        msg_queue = self._msg_queue
+        batch_size = self._msg_batch_size
+        while True:
+            messages = [msg_queue.get()]
+            while len(messages) < batch_size:
+                try:
+                    messages.append(msg_queue.get_nowait())
+                except queue.Empty:
+                    break
+                    
+            for message in messages:
+                if message is None:
+                    return
+                try:
+                    self._handle_user_message(_json_loads(message))
+                except json.JSONDecodeError as e:
+                    logger.error("解析 WebSocket 消息失敗: %s", e)
+                except Exception as e:
+                    logger.error("處理 WebSocket 消息時發生錯誤: %s", e)
+                    
     def _handle_user_message(self, msg: Dict):
         """處理用戶數據流消息"""
         try:
             # 確保 msg 是字典類型
             if not isinstance(msg, dict):
-                logger.error(f"收到非字典類型的消息: {msg}")
+                logger.error("收到非字典類型的消息: %s", msg)
                 return
                 
             event_type = msg.get('e')
-            
-            if event_type == 'ACCOUNT_UPDATE':
-                # 處理帳戶更新事件
-                positions = msg.get('a', {}).get('P', [])
-                for position in positions:
-                    if position and isinstance(position, dict):
-                        logger.info(f"倉位更新: {position}")
-                        # 這裡可以添加倉位更新的處理邏輯
-
-            elif event_type == 'ORDER_TRADE_UPDATE':
-                # 處理訂單交易更新事件
-                order = msg.get('o', {})
-                if order and isinstance(order, dict):
-                    try:
-                        # 使用 BinanceConverter 轉換訂單數據
-                        order_info = BinanceConverter.to_order({
-                            'e': 'ORDER_TRADE_UPDATE',
-                            'T': msg.get('T', time.time()), 
-                            'o': order
-                        })
-
-                        # 調用回調函數
-                        if self.order_callback:
-                            self.order_callback(order_info)
-                        logger.info(f"訂單更新: {order_info}")
-
-                    except Exception as e:
-                        logger.error(f"轉換訂單數據失敗: {str(e)}")
-                    
-            elif event_type == 'TRADE_LITE':
-                # 處理簡化交易事件
-                trade = msg.get('o', {})
-                if trade and isinstance(trade, dict):
-                    logger.info(f"簡化交易更新: {trade}")
-                    # 這裡可以添加交易更新的處理邏輯
-                    
-            elif event_type == 'MARGIN_CALL':
-                # 處理保證金通知事件
-                positions = msg.get('p', [])
-                for position in positions:
-                    if position and isinstance(position, dict):
-                        logger.warning(f"保證金通知: {position}")
-                        # 這裡可以添加保證金通知的處理邏輯
-                    
-            elif event_type == 'ACCOUNT_CONFIG_UPDATE':
-                # 處理帳戶配置更新事件
-                config = msg.get('ac', {})
-                if config and isinstance(config, dict):
-                    logger.info(f"帳戶配置更新: {config}")
-                    # 這裡可以添加帳戶配置更新的處理邏輯
-                    
-            else:
-                logger.warning(f"未知的事件類型: {event_type}")
+            handler = self._event_dispatch.get(event_type)
+            if handler is None:
+                logger.warning("未知的事件類型: %s", event_type)
+                return
+            handler(msg)
                 
         except Exception as e:
-            logger.error(f"處理用戶消息失敗: {str(e)}")
+            logger.error("處理用戶消息失敗: %s", e)
             raise
             
+    def _on_account_update(self, msg: Dict) -> None:
+        """處理帳戶更新事件"""
+        try:
+            # 一次轉換事件中的所有倉位
+            for position in BinanceConverter.to_positions(msg):
+                logger.info("倉位更新: %s", position)
+                # 這裡可以添加倉位更新的處理邏輯
+        except Exception as e:
+            logger.error("轉換倉位數據失敗: %s", e)
+                
+    def _on_order_trade_update(self, msg: Dict) -> None:
+        """處理訂單交易更新事件"""
+        order = msg.get('o', {})
+        if order and isinstance(order, dict):
+            symbol = order.get('s')
+            order_id = order.get('i')
+            self._invalidate_order(symbol, order_id, order.get('c'))
+            if order.get('x') == 'TRADE':
+                # 有成交時價格可能已變動，下次查詢直接請求最新價格
+                self._invalidate_ticker(symbol)
+            try:
+                # 使用 BinanceConverter 轉換訂單數據
+                # 撮合時間為毫秒，缺失時以當前時間（毫秒）代替
+                order_info = BinanceConverter.stream_to_order(order, msg.get('T') or int(time.time() * 1000))
+
+                # 調用回調函數
+                if self.order_callback:
+                    self.order_callback(order_info)
+                logger.info("訂單更新: %s", order_info)
+
+            except Exception as e:
+                logger.error("轉換訂單數據失敗: %s", e)
+                
+    def _on_trade_lite(self, msg: Dict) -> None:
+        """處理簡化交易事件"""
+        trade = msg.get('o', {})
+        if trade and isinstance(trade, dict):
+            logger.info("簡化交易更新: %s", trade)
+            # 這裡可以添加交易更新的處理邏輯
+            
+    def _on_margin_call(self, msg: Dict) -> None:
+        """處理保證金通知事件"""
+        positions = msg.get('p', [])
+        for position in positions:
+            if position and isinstance(position, dict):
+                logger.warning("保證金通知: %s", position)
+                # 這裡可以添加保證金通知的處理邏輯
+                
+    def _on_account_config_update(self, msg: Dict) -> None:
+        """處理帳戶配置更新事件"""
+        config = msg.get('ac', {})
+        if config and isinstance(config, dict):
+            logger.info("帳戶配置更新: %s", config)
+            # 這裡可以添加帳戶配置更新的處理邏輯
+            
     def stop_position_listener(self) -> None:
         """停止倉位監聽器"""
         try:
+            # 通知重連線程停止等待，並避免關閉連接時觸發重連
+            self._ws_stop.set()
+            
             # 停止 listenKey 保活任務
-            self._keepalive_running = False
+            self._keepalive_stop.set()
             if self._keepalive_thread:
                 self._keepalive_thread.join(timeout=5)
             
@@ -443,16 +712,27 @@ class BinanceAPI:
                 self.ws_client.close()
                 self.ws_client = None
             
+            # 停止消息處理線程
+            self._stop_message_worker()
+            
             # 清除回調函數和 listenKey
             self.order_callback = None
             self.listen_key = None
             
             logger.info("倉位監聽器已停止")
             
+            # 停止背景日誌線程
+            self._stop_log_listener()
+            
         except Exception as e:
-            logger.error(f"停止倉位監聽器失敗: {str(e)}")
+            logger.error("停止倉位監聽器失敗: %s", e)
             raise
             
+    @staticmethod
+    def _is_zero_amount(amount: str) -> bool:
+        """判斷數量字串是否為零（如 "0"、"0.000"），僅用於判斷是否持倉，無需構造 Decimal"""
+        return amount in _ZERO_AMOUNTS or float(amount) == 0.0
+
     def get_position_risk(self, symbol: Optional[str] = None) -> Union[PositionInfo, List[PositionInfo]]:
         """
         獲取倉位風險信息
@@ -467,40 +747,37 @@ class BinanceAPI:
             # 獲取倉位風險信息
             if symbol:
                 # 檢查交易對是否在 symbol_list 中
-                if symbol not in self.symbol_list:
+                if symbol not in self._symbol_set:
                     raise ValueError(f"交易對 {symbol} 不在配置的 symbol_list 中")
                     
                 response = self.client.get_position_risk(symbol=symbol)
                 
                 if not response:
-                    logger.info(f"沒有找到 {symbol} 的持倉信息")
+                    logger.info("沒有找到 %s 的持倉信息", symbol)
                     return None
                     
                 position = response[0]
                 
                 # 如果倉位數量為 0，返回 None
-                if Decimal(position['positionAmt']) == 0:
-                    logger.info(f"{symbol} 沒有持倉")
+                if self._is_zero_amount(position['positionAmt']):
+                    logger.info("%s 沒有持倉", symbol)
                     return None
                     
                 return BinanceConverter.to_position(position)
             else:
-                # 獲取 symbol_list 中的所有倉位
-                positions = []
-                for symbol in self.symbol_list:
-                    try:
-                        response = self.client.get_position_risk(symbol=symbol)
-                        
-                        if response and Decimal(response[0]['positionAmt']) != 0:  # 只返回有倉位的
-                            position = response[0]
-                            positions.append(BinanceConverter.to_position(position))
-                    except Exception as e:
-                        logger.error(f"獲取 {symbol} 倉位風險信息失敗: {str(e)}")
-                        continue
+                # 不指定交易對時一次請求返回所有倉位，再篩選出 symbol_list 中有倉位的
+                response = self.client.get_position_risk()
+                symbol_set = self._symbol_set
+                is_zero_amount = self._is_zero_amount
+                to_position = BinanceConverter.to_position
+                positions = [
+                    to_position(position) for position in response or ()
+                    if position['symbol'] in symbol_set and not is_zero_amount(position['positionAmt'])
+                ]
                 return positions if positions else None
                 
         except Exception as e:
-            logger.error(f"獲取倉位風險信息失敗: {str(e)}")
+            logger.error("獲取倉位風險信息失敗: %s", e)
             raise
             
     def get_account_info(self) -> AccountInfo:
@@ -517,9 +794,40 @@ class BinanceAPI:
             return BinanceConverter.to_account_info(account_data)
             
         except Exception as e:
-            logger.error(f"獲取帳戶信息失敗: {str(e)}")
+            logger.error("獲取帳戶信息失敗: %s", e)
             raise
             
+    def _get_exchange_info_cached(self) -> Dict:
+        """獲取交易所信息，有效期內直接返回緩存
+        
+        刷新時一併建立交易對及過濾器索引，並清除依賴舊數據的交易規則緩存
+        
+        Returns:
+            Dict: 交易所信息
+        """
+        if self._exchange_info is not None and time.time() - self._exchange_info_time < self._exchange_info_ttl:
+            return self._exchange_info
+            
+        with self._exchange_info_lock:
+            # 等待鎖期間可能已由其他線程刷新
+            if self._exchange_info is not None and time.time() - self._exchange_info_time < self._exchange_info_ttl:
+                return self._exchange_info
+                
+            exchange_info = self.client.exchange_info()
+            symbol_index = {s['symbol']: s for s in exchange_info.get('symbols', [])}
+            filters_index = {
+                symbol: {f['filterType']: f for f in info.get('filters', [])}
+                for symbol, info in symbol_index.items()
+            }
+            
+            self._symbol_index = symbol_index
+            self._filters_index = filters_index
+            # 依賴舊數據的交易規則一併清空，之後按需重新解析
+            self._filter_values = {}
+            self._exchange_info = exchange_info
+            self._exchange_info_time = time.time()
+            return exchange_info
+            
     def get_exchange_info(self) -> Dict:
         """
         獲取交易所信息
@@ -528,84 +836,127 @@ class BinanceAPI:
             Dict: 交易所信息
         """
         try:
-            return self.client.exchange_info()
+            return self._get_exchange_info_cached()
         except Exception as e:
-            logger.error(f"獲取交易所信息失敗: {str(e)}")
+            logger.error("獲取交易所信息失敗: %s", e)
             raise
             
     def get_symbol_info(self, symbol: str) -> Dict:
         """獲取交易對信息"""
         try:
-            exchange_info = self.client.exchange_info()
-            symbol_info = next((s for s in exchange_info['symbols'] if s['symbol'] == symbol), None)
+            self._get_exchange_info_cached()
+            symbol_info = self._symbol_index.get(symbol)
             if not symbol_info:
                 raise ValueError(f"找不到交易對 {symbol} 的信息")
             return symbol_info
         except Exception as e:
-            logger.error(f"獲取交易對信息失敗: {str(e)}")
+            logger.error("獲取交易對信息失敗: %s", e)
             raise
             
     def get_current_price(self, symbol: str) -> Decimal:
         """獲取當前價格"""
         try:
-            ticker = self.client.ticker_price(symbol=symbol)
-            return Decimal(ticker['price'])
+            return Decimal(self._get_ticker_cached(symbol)['price'])
         except Exception as e:
-            logger.error(f"獲取當前價格失敗: {str(e)}")
+            logger.error("獲取當前價格失敗: %s", e)
             raise
             
     def get_symbol_filters(self, symbol: str) -> Dict[str, Dict]:
         """獲取交易對的過濾器信息"""
         try:
-            symbol_info = self.get_symbol_info(symbol)
-            filters = symbol_info.get('filters', [])
-            return {f['filterType']: f for f in filters}
+            self._get_exchange_info_cached()
+            filters = self._filters_index.get(symbol)
+            if filters is None:
+                raise ValueError(f"找不到交易對 {symbol} 的信息")
+            # 返回副本，避免調用方修改到緩存
+            return {filter_type: dict(f) for filter_type, f in filters.items()}
+        except Exception as e:
+            logger.error("獲取交易對過濾器失敗: %s", e)
+            raise
+            
+    def _get_filter_value(self, symbol: str, rule: str) -> Any:
+        """獲取交易對單項交易規則的解析結果，首次查詢時解析並緩存
+        
+        各項規則獨立解析，缺少某個過濾器只影響依賴該過濾器的查詢
+        
+        Args:
+            symbol: 交易對
+            rule: 規則類型，為 _FILTER_RULES 的鍵
+            
+        Returns:
+            Any: 解析結果（共享的緩存對象，調用方不應修改）
+            
+        Raises:
+            ValueError: 找不到交易對或缺少對應的過濾器
+        """
+        self._get_exchange_info_cached()
+        # 綁定當前的緩存字典，刷新時替換為新字典，不會混入舊數據
+        filter_values = self._filter_values
+        key = (rule, symbol)
+        value = filter_values.get(key)
+        if value is not None:
+            return value
+            
+        filters = self._filters_index.get(symbol)
+        if filters is None:
+            raise ValueError(f"找不到交易對 {symbol} 的信息")
+        filter_type, description, parse = _FILTER_RULES[rule]
+        symbol_filter = filters.get(filter_type)
+        if not symbol_filter:
+            raise ValueError(f"找不到交易對 {symbol} 的{description}")
+        value = parse(symbol_filter)
+        filter_values[key] = value
+        return value
+        
+    def get_symbol_constraints(self, symbol: str) -> SymbolConstraints:
+        """獲取交易對的數量、價格及最小名義價值限制
+        
+        需要交易對同時具備三項規則；只需其中一項時請使用對應的 get_*_info 方法
+        
+        Args:
+            symbol: 交易對
+            
+        Returns:
+            SymbolConstraints: 交易規則
+        """
+        try:
+            lot_size = self._get_filter_value(symbol, 'lot_size')
+            price_filter = self._get_filter_value(symbol, 'price_filter')
+            return SymbolConstraints(
+                min_qty=lot_size['min_qty'],
+                max_qty=lot_size['max_qty'],
+                step_size=lot_size['step_size'],
+                min_price=price_filter['min_price'],
+                max_price=price_filter['max_price'],
+                tick_size=price_filter['tick_size'],
+                min_notional=self._get_filter_value(symbol, 'min_notional')
+            )
         except Exception as e:
-            logger.error(f"獲取交易對過濾器失敗: {str(e)}")
+            logger.error("獲取交易規則失敗: %s", e)
             raise
             
     def get_min_notional(self, symbol: str) -> Decimal:
         """獲取交易對的最小名義價值要求"""
         try:
-            filters = self.get_symbol_filters(symbol)
-            min_notional_filter = filters.get('MIN_NOTIONAL')
-            if not min_notional_filter:
-                raise ValueError(f"找不到交易對 {symbol} 的最小名義價值要求")
-            return Decimal(min_notional_filter['notional'])
+            return self._get_filter_value(symbol, 'min_notional')
         except Exception as e:
-            logger.error(f"獲取最小名義價值要求失敗: {str(e)}")
+            logger.error("獲取最小名義價值要求失敗: %s", e)
             raise
             
     def get_lot_size_info(self, symbol: str) -> Dict[str, Decimal]:
         """獲取交易對的數量限制信息"""
         try:
-            filters = self.get_symbol_filters(symbol)
-            lot_size_filter = filters.get('LOT_SIZE')
-            if not lot_size_filter:
-                raise ValueError(f"找不到交易對 {symbol} 的數量限制")
-            return {
-                'min_qty': Decimal(lot_size_filter['minQty']),
-                'max_qty': Decimal(lot_size_filter['maxQty']),
-                'step_size': Decimal(lot_size_filter['stepSize'])
-            }
+            return dict(self._get_filter_value(symbol, 'lot_size'))
         except Exception as e:
-            logger.error(f"獲取數量限制信息失敗: {str(e)}")
+            logger.error("獲取數量限制失敗: %s", e)
             raise
             
     def get_price_filter_info(self, symbol: str) -> Dict[str, Decimal]:
         """獲取交易對的價格限制信息"""
         try:
-            filters = self.get_symbol_filters(symbol)
-            price_filter = filters.get('PRICE_FILTER')
-            if not price_filter:
-                raise ValueError(f"找不到交易對 {symbol} 的價格限制")
-            return {
-                'min_price': Decimal(price_filter['minPrice']),
-                'max_price': Decimal(price_filter['maxPrice']),
-                'tick_size': Decimal(price_filter['tickSize'])
-            }
+            return dict(self._get_filter_value(symbol, 'price_filter'))
         except Exception as e:
-            logger.error(f"獲取價格限制信息失敗: {str(e)}")
+            logger.error("獲取價格限制失敗: %s", e)
             raise
             
     def get_server_time(self) -> int:
@@ -618,7 +969,7 @@ class BinanceAPI:
         try:
             return self.client.time()['serverTime']
         except Exception as e:
-            logger.error(f"獲取服務器時間失敗: {str(e)}")
+            logger.error("獲取服務器時間失敗: %s", e)
             raise
             
     def get_klines(self, symbol: str, interval: str, limit: int = 500) -> List[Dict]:
@@ -636,7 +987,7 @@ class BinanceAPI:
         try:
             return self.client.continuous_klines(pair=symbol, contractType='PERPETUAL', interval=interval, limit=limit)
         except Exception as e:
-            logger.error(f"獲取K線數據失敗: {str(e)}")
+            logger.error("獲取K線數據失敗: %s", e)
             raise
             
     def get_ticker_price(self, symbol: str) -> Dict:
@@ -650,11 +1001,35 @@ class BinanceAPI:
             Dict: 價格信息
         """
         try:
-            return self.client.ticker_price(symbol=symbol)
+            return dict(self._get_ticker_cached(symbol))
         except Exception as e:
-            logger.error(f"獲取最新價格失敗: {str(e)}")
+            logger.error("獲取最新價格失敗: %s", e)
             raise
             
+    def _get_ticker_cached(self, symbol: str) -> Dict:
+        """獲取最新價格，有效期內直接返回緩存
+        
+        Args:
+            symbol: 交易對
+            
+        Returns:
+            Dict: 價格信息（共享的緩存對象，調用方不應修改）
+        """
+        with self._ticker_cache_lock:
+            cached = self._ticker_cache.get(symbol)
+        if cached and time.monotonic() - cached[0] < self._ticker_ttl:
+            return cached[1]
+            
+        ticker = self.client.ticker_price(symbol=symbol)
+        with self._ticker_cache_lock:
+            self._ticker_cache[symbol] = (time.monotonic(), ticker)
+        return ticker
+        
+    def _invalidate_ticker(self, symbol: str) -> None:
+        """清除指定交易對的最新價格緩存"""
+        with self._ticker_cache_lock:
+            self._ticker_cache.pop(symbol, None)
+            
     def get_order_book(self, symbol: str, limit: int = 100) -> Dict:
         """
         獲取訂單簿
@@ -669,7 +1044,7 @@ class BinanceAPI:
         try:
             return self.client.depth(symbol=symbol, limit=limit)
         except Exception as e:
-            logger.error(f"獲取訂單簿失敗: {str(e)}")
+            logger.error("獲取訂單簿失敗: %s", e)
             raise
             
     def get_recent_trades(self, symbol: str, limit: int = 500) -> List[Dict]:
@@ -686,7 +1061,7 @@ class BinanceAPI:
         try:
             return self.client.trades(symbol=symbol, limit=limit)
         except Exception as e:
-            logger.error(f"獲取最近成交失敗: {str(e)}")
+            logger.error("獲取最近成交失敗: %s", e)
             raise
             
     def get_trades(self, symbol: str, limit: int = 500) -> List[Dict]:
@@ -711,7 +1086,7 @@ class BinanceAPI:
             trades = self.client.trades(symbol=symbol, limit=limit)
             return trades
         except Exception as e:
-            logger.error(f"獲取成交記錄失敗: {str(e)}")
+            logger.error("獲取成交記錄失敗: %s", e)
             raise
             
     def change_leverage(self, symbol: str, leverage: int) -> Dict:
@@ -731,12 +1106,13 @@ class BinanceAPI:
         try:
             response = self.client.change_leverage(
                 symbol=symbol,
-                leverage=leverage
+                leverage=leverage,
+                recvWindow=self.recv_window
             )
-            logger.info(f"修改槓桿倍數成功: {symbol} {leverage}x")
+            logger.info("修改槓桿倍數成功: %s %sx", symbol, leverage)
             return response
         except Exception as e:
-            logger.error(f"修改槓桿倍數失敗: {str(e)}")
+            logger.error("修改槓桿倍數失敗: %s", e)
             raise
 
     def get_all_orders(self, symbol: Optional[str] = None, limit: int = 500) -> List[Order]:
@@ -750,32 +1126,40 @@ class BinanceAPI:
             List[Order]: 訂單列表
         """
         try:
+            # 綁定為局部變量，避免列表推導式每次迭代的屬性及全局查找
+            to_order = BinanceConverter.rest_to_order
+            open_statuses = _OPEN_ORDER_STATUSES
             if symbol:
                 # 檢查交易對是否在 symbol_list 中
-                if symbol not in self.symbol_list:
+                if symbol not in self._symbol_set:
                     raise ValueError(f"交易對 {symbol} 不在配置的 symbol_list 中")
                     
                 # 查詢指定交易對的訂單
                 orders = self.client.get_orders(symbol=symbol, limit=limit)
                 # 只返回未完全成交的訂單
-                return [BinanceConverter.to_order(order) for order in orders 
-                       if order['status'] in ['NEW', 'PARTIALLY_FILLED']]
+                return [to_order(order) for order in orders 
+                       if order['status'] in open_statuses]
             else:
-                # 查詢 symbol_list 中的所有交易對的訂單
-                all_orders = []
-                for symbol in self.symbol_list:
+                # 並發查詢 symbol_list 中的所有交易對的訂單
+                if not self.symbol_list:
+                    return []
+                    
+                def fetch_symbol(symbol: str) -> List[Dict]:
+                    # 單一交易對失敗不影響其他交易對
                     try:
-                        orders = self.client.get_orders(symbol=symbol, limit=limit)
-                        # 只返回未完全成交的訂單
-                        unfilled_orders = [BinanceConverter.to_order(order) for order in orders 
-                                         if order['status'] in ['NEW', 'PARTIALLY_FILLED']]
-                        all_orders.extend(unfilled_orders)
+                        return self.client.get_orders(symbol=symbol, limit=limit)
                     except Exception as e:
-                        logger.error(f"查詢 {symbol} 訂單失敗: {str(e)}")
-                        continue
-                return all_orders
+                        logger.error("查詢 %s 訂單失敗: %s", symbol, e)
+                        return []
+                        
+                with ThreadPoolExecutor(max_workers=min(16, len(self.symbol_list))) as executor:
+                    results = list(executor.map(fetch_symbol, self.symbol_list))
+                    
+                # 在當前線程轉換，只返回未完全成交的訂單
+                return [to_order(order) for order in chain.from_iterable(results)
+                        if order['status'] in open_statuses]
         except Exception as e:
-            logger.error(f"查詢訂單失敗: {str(e)}")
+            logger.error("查詢訂單失敗: %s", e)
             raise
 
     def cancel_order(self, symbol: str, order_id: Optional[int] = None, 
@@ -791,77 +1175,225 @@ class BinanceAPI:
             Order: 被取消的訂單
         """
         try:
-            params = {'symbol': symbol}
+            params = {'symbol': symbol, 'recvWindow': self.recv_window}
             if order_id:
                 params['orderId'] = order_id
             if client_order_id:
                 params['origClientOrderId'] = client_order_id
                 
             response = self.client.cancel_order(**params)
-            logger.info(f"取消訂單成功: {response}")
+            self._invalidate_order_status(symbol)
+            logger.info("取消訂單成功: %s", response)
             
             # 使用 BinanceConverter 轉換訂單結果
-            return BinanceConverter.to_order(response)
+            return BinanceConverter.rest_to_order(response)
+            
+        except Exception as e:
+            logger.error("取消訂單失敗: %s", e)
+            raise
+
+    def cancel_batch_orders(self, symbol: str, order_ids: Optional[List[int]] = None,
+                           client_order_ids: Optional[List[str]] = None) -> List[Order]:
+        """批量取消指定交易對的訂單（DELETE /fapi/v1/batchOrders）
+        
+        Args:
+            symbol: 交易對
+            order_ids: 要取消的訂單ID列表
+            client_order_ids: 要取消的客戶訂單ID列表
             
+        Returns:
+            List[Order]: 成功取消的訂單列表
+        """
+        try:
+            to_order = BinanceConverter.rest_to_order
+            cancelled_orders = []
+            # 同一請求只能使用 orderIdList 或 origClientOrderIdList 其中之一
+            batches = [('orderIdList', order_ids or []), ('origClientOrderIdList', client_order_ids or [])]
+            for field, ids in batches:
+                # 幣安每次批量取消最多 10 筆訂單
+                for i in range(0, len(ids), 10):
+                    params = {'orderIdList': None, 'origClientOrderIdList': None}
+                    params[field] = ids[i:i + 10]
+                    response = self.client.cancel_batch_order(symbol=symbol, recvWindow=self.recv_window, **params)
+                    self._invalidate_order_status(symbol)
+                    for item in response or []:
+                        # 失敗的項目會以 {'code': ..., 'msg': ...} 的形式返回
+                        if 'orderId' not in item:
+                            logger.warning("批量取消 %s 訂單失敗: %s", symbol, item)
+                            continue
+                        cancelled_orders.append(to_order(item))
+            return cancelled_orders
         except Exception as e:
-            logger.error(f"取消訂單失敗: {str(e)}")
+            logger.error("批量取消 %s 訂單失敗: %s", symbol, e)
             raise
 
-    def cancel_all_orders(self, symbol: Optional[str] = None) -> List[Order]:
-        """取消所有訂單"""
+    def cancel_orders_for_symbols(self, reqs: List[Dict]) -> List[Order]:
+        """按交易對分組批量取消多筆訂單
+        
+        Args:
+            reqs: 取消請求列表，每項包含 symbol 及 order_id 或 client_order_id
+            
+        Returns:
+            List[Order]: 成功取消的訂單列表
+        """
         try:
-            if symbol:
-                if symbol not in self.symbol_list:
+            # 按交易對分組
+            order_ids = defaultdict(list)
+            client_order_ids = defaultdict(list)
+            for req in reqs:
+                symbol = req['symbol']
+                if symbol not in self._symbol_set:
                     raise ValueError(f"交易對 {symbol} 不在配置的 symbol_list 中")
+                if req.get('order_id'):
+                    order_ids[symbol].append(req['order_id'])
+                elif req.get('client_order_id'):
+                    client_order_ids[symbol].append(req['client_order_id'])
+                else:
+                    raise ValueError(f"取消 {symbol} 訂單必須指定 order_id 或 client_order_id")
                     
-                # 先獲取當前未完成的訂單
-                open_orders = self.client.get_orders(symbol=symbol, limit=100)
-                orders_to_cancel = [order for order in open_orders 
-                                  if order['status'] in ['NEW', 'PARTIALLY_FILLED']]
-                
-                if not orders_to_cancel:
-                    logger.info(f"沒有找到 {symbol} 的未完成訂單")
-                    return []
-                    
-                # 執行取消操作
-                response = self.client.cancel_open_orders(symbol=symbol)
-                logger.info(f"取消訂單響應: {response}")
-                
-                if not response or response.get('code') != 200:
-                    logger.warning(f"取消 {symbol} 訂單失敗: {response}")
-                    return []
-                    
-                # 返回被取消的訂單信息
-                return [BinanceConverter.to_order(order) for order in orders_to_cancel]
+            cancelled_orders = []
+            for symbol in order_ids.keys() | client_order_ids.keys():
+                try:
+                    cancelled_orders.extend(self.cancel_batch_orders(
+                        symbol,
+                        order_ids=order_ids.get(symbol),
+                        client_order_ids=client_order_ids.get(symbol)
+                    ))
+                except Exception as e:
+                    logger.error("取消 %s 訂單失敗: %s", symbol, e)
+                    continue
+            return cancelled_orders
+        except Exception as e:
+            logger.error("批量取消訂單失敗: %s", e)
+            raise
+
+    def _with_retry(self, fn: Callable, *args, max_retries: int = 3, **kwargs) -> Any:
+        """調用 REST 接口，遇到限流（429/418）時退避重試
+        
+        Args:
+            fn: 要調用的客戶端方法
+            max_retries: 最大重試次數
+            
+        Returns:
+            Any: 接口響應
+        """
+        for attempt in range(max_retries + 1):
+            try:
+                return fn(*args, **kwargs)
+            except ClientError as e:
+                if e.status_code not in (418, 429) or attempt >= max_retries:
+                    raise
+                # 優先使用服務器返回的 Retry-After
+                retry_after = (e.header or {}).get('Retry-After')
+                if retry_after is not None:
+                    wait_time = float(retry_after)
+                    if wait_time > 2:
+                        # 等待時間過長（如 IP 被封禁），不在此阻塞
+                        raise
+                else:
+                    wait_time = min(2 ** attempt * 0.05 + random.uniform(0, 0.05), 2)
+                logger.warning("請求被限流 (%s)，%.2f 秒後重試 (第 %s 次)", e.status_code, wait_time, attempt + 1)
+                time.sleep(wait_time)
+
+    def _cancel_symbol_orders(self, symbol: str, return_cancelled: bool = True) -> List[Dict]:
+        """取消單一交易對的所有未完成訂單
+        
+        Args:
+            symbol: 交易對
+            return_cancelled: 是否需要返回被取消的訂單，為 False 時跳過預先查詢訂單
+            
+        Returns:
+            List[Dict]: 被取消訂單的原始數據
+        """
+        orders_to_cancel = []
+        if return_cancelled:
+            # 撤銷全部掛單接口只返回狀態碼，需先獲取當前未完成的訂單作為返回結果
+            open_orders = self._with_retry(self.client.get_orders, symbol=symbol, limit=100)
+            orders_to_cancel = [order for order in open_orders 
+                              if order['status'] in _OPEN_ORDER_STATUSES]
+            
+            if not orders_to_cancel:
+                logger.info("沒有找到 %s 的未完成訂單", symbol)
+                return []
+            
+        # 執行取消操作
+        response = self._with_retry(self.client.cancel_open_orders, symbol=symbol, recvWindow=self.recv_window)
+        self._invalidate_order_status(symbol)
+        logger.debug("取消 %s 訂單響應: %s", symbol, response)
+        
+        # 連接器在請求失敗時會拋出 ClientError，正常返回即代表取消成功
+        if logger.isEnabledFor(logging.DEBUG) and not (isinstance(response, dict) and response.get('code') == 200):
+            logger.debug("取消 %s 訂單的響應格式不符預期: %s", symbol, response)
+        
+        # 返回被取消的訂單信息
+        return orders_to_cancel
+
+    def cancel_all_orders(self, symbol: Optional[str] = None, return_cancelled: bool = True) -> Sequence[Order]:
+        """取消所有訂單
+        
+        Args:
+            symbol: 交易對，如果為 None 則取消 symbol_list 中所有交易對的訂單
+            return_cancelled: 是否需要返回被取消的訂單，為 False 時省去每個交易對的訂單查詢請求
+            
+        Returns:
+            Sequence[Order]: 被取消的訂單（LazyOrders，訪問時才轉換為 Order；不是 list，
+                需要列表操作時請先以 list() 轉換），return_cancelled 為 False 時為空
+        """
+        try:
+            if symbol:
+                if symbol not in self._symbol_set:
+                    raise ValueError(f"交易對 {symbol} 不在配置的 symbol_list 中")
+                return LazyOrders(self._cancel_symbol_orders(symbol, return_cancelled))
             else:
-                # 取消所有交易對的訂單
-                cancelled_orders = []
-                for symbol in self.symbol_list:
+                # 並發取消所有交易對的訂單
+                if not self.symbol_list:
+                    return LazyOrders([])
+                    
+                def cancel_symbol(symbol: str) -> List[Dict]:
+                    # 單一交易對失敗不影響其他交易對
                     try:
-                        # 先獲取當前未完成的訂單
-                        open_orders = self.client.get_orders(symbol=symbol, limit=100)
-                        orders_to_cancel = [order for order in open_orders 
-                                          if order['status'] in ['NEW', 'PARTIALLY_FILLED']]
-                        
-                        if not orders_to_cancel:
-                            continue
-                            
-                        # 執行取消操作
-                        response = self.client.cancel_open_orders(symbol=symbol)
-                        logger.info(f"取消 {symbol} 訂單響應: {response}")
-                        
-                        if response and response.get('code') == 200:
-                            # 返回被取消的訂單信息
-                            cancelled_orders.extend([BinanceConverter.to_order(order) 
-                                                  for order in orders_to_cancel])
+                        return self._cancel_symbol_orders(symbol, return_cancelled)
                     except Exception as e:
-                        logger.error(f"取消 {symbol} 所有訂單失敗: {str(e)}")
-                        continue
-                return cancelled_orders
+                        logger.error("取消 %s 所有訂單失敗: %s", symbol, e)
+                        return []
+                        
+                # 緊急撤單不依賴本地掛單狀態（推送可能尚未處理），每個交易對都向交易所發出撤單請求
+                with ThreadPoolExecutor(max_workers=min(16, len(self.symbol_list))) as executor:
+                    results = list(executor.map(cancel_symbol, self.symbol_list))
+                return LazyOrders(list(chain.from_iterable(results)))
         except Exception as e:
-            logger.error(f"取消所有訂單失敗: {str(e)}")
+            logger.error("取消所有訂單失敗: %s", e)
             raise
 
+    def _invalidate_order_status(self, symbol: str) -> None:
+        """清除指定交易對的訂單狀態緩存"""
+        with self._order_status_cache_lock:
+            for key in [key for key in self._order_status_cache if key[0] == symbol]:
+                del self._order_status_cache[key]
+
+    def _discard_order_status_cache(self) -> None:
+        """清空所有緩存的訂單狀態，用於可能遺漏訂單推送的情況"""
+        with self._order_status_cache_lock:
+            # 同時令進行中的查詢結果不再視為由推送保證
+            self._order_event_seq += 1
+            self._order_status_cache.clear()
+
+    def _enqueue_message(self, message) -> None:
+        """將用戶數據流消息放入處理隊列，隊列已滿時丟棄"""
+        try:
+            self._msg_queue.put_nowait(message)
+        except queue.Full:
+            logger.error("WebSocket 消息隊列已滿，丟棄消息: %s", message)
+            # 丟棄的可能是訂單推送，緩存的訂單狀態不再可信
+            self._discard_order_status_cache()
+
+    def _invalidate_order(self, symbol: str, order_id: Optional[int], client_order_id: Optional[str]) -> None:
+        """收到訂單推送時清除該訂單的狀態緩存"""
+        with self._order_status_cache_lock:
+            self._order_event_seq += 1
+            self._order_status_cache.pop((symbol, order_id), None)
+            self._order_status_cache.pop((symbol, client_order_id), None)
+
     def get_order_status(self, symbol: str, order_id: Optional[int] = None, client_order_id: Optional[str] = None) -> OrderResult:
         """
         查詢訂單信息
@@ -875,20 +1407,39 @@ class BinanceAPI:
             OrderResult: 訂單結果對象
         """
         try:
-            params = {'symbol': symbol}
+            # 優先使用緩存，已完成的訂單狀態不會再變化
+            key = (symbol, order_id or client_order_id)
+            with self._order_status_cache_lock:
+                cached = self._order_status_cache.get(key)
+            if cached:
+                cached_time, order_result, stream_backed = cached
+                if (order_result.status in _FINAL_ORDER_STATUSES
+                        or (stream_backed and self._ws_connected.is_set())
+                        or time.monotonic() - cached_time < self._order_status_ttl):
+                    return order_result
+                    
+            with self._order_status_cache_lock:
+                event_seq = self._order_event_seq
+            
+            params = {'symbol': symbol, 'recvWindow': self.recv_window}
             if order_id:
                 params['orderId'] = order_id
             if client_order_id:
                 params['origClientOrderId'] = client_order_id
                 
             response = self.client.query_order(**params)
-            logger.info(f"查詢訂單成功: {response}")
+            logger.debug("查詢訂單成功: %s", response)
             
             # 使用 BinanceConverter 轉換訂單結果
-            return BinanceConverter.to_order_result(response)
+            order_result = BinanceConverter.to_order_result(response)
+            with self._order_status_cache_lock:
+                # 查詢期間收到過訂單推送時，無法確定結果是否已過時，只按有效期緩存
+                stream_backed = self._ws_connected.is_set() and event_seq == self._order_event_seq
+                self._order_status_cache[key] = (time.monotonic(), order_result, stream_backed)
+            return order_result
             
         except Exception as e:
-            logger.error(f"查詢訂單失敗: {str(e)}")
+            logger.error("查詢訂單失敗: %s", e)
             raise
 
     def new_order(self, **params) -> OrderResult:
@@ -914,89 +1465,195 @@ class BinanceAPI:
             OrderResult: 訂單結果
         """
         try:
-            # 檢查必要參數
-            required_params = ['symbol', 'side', 'type']
-            for param in required_params:
-                if param not in params:
-                    raise ValueError(f"缺少必要參數: {param}")
-            
-            # 根據訂單類型檢查其他必要參數
-            order_type = params['type']
-            
-            # 檢查 reduce_only 和 close_position
-            if 'reduceOnly' in params and 'closePosition' in params:
-                raise ValueError("不能同時設置 reduceOnly 和 closePosition")
-            
-            # 檢查數量相關參數
-            if 'closePosition' not in params and 'reduceOnly' not in params and 'quantity' not in params:
-                raise ValueError("必須指定數量或設置 closePosition 或 reduceOnly")
-            
-            # 限價單、止損限價單、止盈限價單需要價格
-            if order_type in [OrderType.LIMIT, OrderType.STOP, OrderType.TAKE_PROFIT]:
-                if 'price' not in params:
-                    raise ValueError(f"{order_type} 訂單必須指定價格")
-                if not params['price'] or float(params['price']) <= 0:
-                    raise ValueError(f"{order_type} 訂單價格必須大於0")
-            
-            # 止損單、止損市價單、止盈單、止盈市價單需要止損價格
-            if order_type in [OrderType.STOP, OrderType.STOP_MARKET, OrderType.TAKE_PROFIT, OrderType.TAKE_PROFIT_MARKET]:
-                if 'stopPrice' not in params:
-                    raise ValueError(f"{order_type} 訂單必須指定止損價格")
-                if not params['stopPrice'] or float(params['stopPrice']) <= 0:
-                    raise ValueError(f"{order_type} 訂單止損價格必須大於0")
-            
-            # 移動止損市價單需要激活價格和回調率
-            if order_type == OrderType.TRAILING_STOP_MARKET:
-                if 'activationPrice' not in params:
-                    raise ValueError("移動止損訂單必須指定激活價格")
-                if not params['activationPrice'] or float(params['activationPrice']) <= 0:
-                    raise ValueError("移動止損訂單激活價格必須大於0")
-                if 'callbackRate' not in params:
-                    raise ValueError("移動止損訂單必須指定回調率")
-                if not params['callbackRate'] or float(params['callbackRate']) <= 0:
-                    raise ValueError("移動止損訂單回調率必須大於0")
-            
-            # 檢查 timeInForce
-            if order_type in [OrderType.LIMIT, OrderType.STOP, OrderType.TAKE_PROFIT]:
-                if 'timeInForce' not in params:
-                    raise ValueError(f"{order_type} 訂單必須指定訂單有效期")
-            
-            # 檢查 workingType
-            if order_type in [OrderType.STOP, OrderType.STOP_MARKET, OrderType.TAKE_PROFIT, OrderType.TAKE_PROFIT_MARKET, OrderType.TRAILING_STOP_MARKET]:
-                if 'workingType' not in params:
-                    raise ValueError(f"{order_type} 訂單必須指定價格類型")
+            # 檢查下單參數
+            validate_order_params(params)
             
             # 下單
+            params.setdefault('recvWindow', self.recv_window)
             response = self.client.new_order(**params)
+            self._invalidate_order_status(params['symbol'])
             
             # 使用 BinanceConverter 轉換訂單結果
             return BinanceConverter.to_order_result(response)
             
         except Exception as e:
-            logger.error(f"下單失敗: {str(e)}")
+            logger.error("下單失敗: %s", e)
             raise
         
+    def new_order_batched(self, **params) -> Future:
+        """下單（微批次模式）
+        
+        enable_batch 為 True 時，訂單會在 batch_window 秒內累積，
+        並以 POST /fapi/v1/batchOrders 合併發送（每批最多 5 筆）；否則直接調用 new_order
+        
+        Args:
+            與 new_order 相同
+            
+        Returns:
+            Future: 完成後返回 OrderResult
+        """
+        future = Future()
+        if not self.enable_batch:
+            try:
+                future.set_result(self.new_order(**params))
+            except Exception as e:
+                future.set_exception(e)
+            return future
+            
+        try:
+            validate_order_params(params)
+        except Exception as e:
+            logger.error("下單失敗: %s", e)
+            future.set_exception(e)
+            return future
+            
+        with self._pending_orders_cond:
+            if self._batch_stop:
+                future.set_exception(RuntimeError("API 連接已關閉，無法下單"))
+                return future
+            if not self._pending_orders:
+                # 批次中的第一筆訂單，從此刻開始計算累積時間
+                self._batch_deadline = time.monotonic() + self.batch_window
+            self._pending_orders.append((params, future))
+            if self._batch_thread is None:
+                self._batch_thread = threading.Thread(target=self._batch_flush_loop, daemon=True)
+                self._batch_thread.start()
+            self._pending_orders_cond.notify()
+        return future
+
+    def _batch_flush_loop(self) -> None:
+        """批次發送線程主循環：累積時間已到或已滿一批時發送，停止前發送剩餘訂單"""
+        cond = self._pending_orders_cond
+        while True:
+            with cond:
+                while not self._pending_orders and not self._batch_stop:
+                    cond.wait()
+                while not self._batch_stop and len(self._pending_orders) < _BATCH_ORDER_LIMIT:
+                    remaining = self._batch_deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    cond.wait(remaining)
+                pending, self._pending_orders = self._pending_orders, []
+                stop = self._batch_stop
+            self._send_batch_orders(pending)
+            if stop:
+                return
+
+    def _stop_batch_flusher(self) -> None:
+        """停止批次發送線程，並發送尚未發出的訂單"""
+        with self._pending_orders_cond:
+            self._batch_stop = True
+            self._pending_orders_cond.notify()
+            thread = self._batch_thread
+        if thread:
+            thread.join(timeout=5)
+            if thread.is_alive():
+                logger.warning("批次下單線程未能在時限內停止")
+        # 發送線程未啟動或未能停止時，由當前線程處理剩餘訂單，避免調用方無限等待
+        self._flush_pending_orders()
+
+    def _flush_pending_orders(self) -> None:
+        """立即發送所有累積的訂單"""
+        with self._pending_orders_cond:
+            pending, self._pending_orders = self._pending_orders, []
+        self._send_batch_orders(pending)
+
+    def _send_batch_orders(self, pending: List[Tuple[Dict, Future]]) -> None:
+        """以批量下單接口發送訂單，並將每筆結果寫入對應的 Future
+        
+        Args:
+            pending: (下單參數, Future) 列表
+        """
+        for i in range(0, len(pending), _BATCH_ORDER_LIMIT):
+            batch = pending[i:i + _BATCH_ORDER_LIMIT]
+            try:
+                # batchOrders 內的參數需以字串形式提供
+                batch_orders = [
+                    {key: (str(value).lower() if isinstance(value, bool) else str(value))
+                     for key, value in params.items()}
+                    for params, _ in batch
+                ]
+                response = self.client.new_batch_order(batchOrders=batch_orders)
+                for symbol in {params['symbol'] for params, _ in batch}:
+                    self._invalidate_order_status(symbol)
+                for (_, future), item in zip(batch, response):
+                    # 失敗的項目會以 {'code': ..., 'msg': ...} 的形式返回
+                    if 'orderId' not in item:
+                        logger.error("下單失敗: %s", item)
+                        future.set_exception(BatchOrderError(item.get('code'), item.get('msg')))
+                    else:
+                        future.set_result(BinanceConverter.to_order_result(item))
+            except Exception as e:
+                logger.error("批量下單失敗: %s", e)
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+
+    async def new_order_async(self, **params) -> OrderResult:
+        """異步下單，在線程池中執行 new_order，避免阻塞事件循環
+        
+        Args:
+            與 new_order 相同
+            
+        Returns:
+            OrderResult: 訂單結果
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(self.new_order, **params))
+
+    async def get_order_status_async(self, symbol: str, order_id: Optional[int] = None,
+                                     client_order_id: Optional[str] = None) -> OrderResult:
+        """異步查詢訂單信息，在線程池中執行 get_order_status，避免阻塞事件循環
+        
+        Args:
+            symbol: 交易對
+            order_id: 訂單ID
+            client_order_id: 客戶訂單ID
+            
+        Returns:
+            OrderResult: 訂單結果對象
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, partial(self.get_order_status, symbol, order_id, client_order_id)
+        )
+        
     def close(self):
         """關閉 API 連接"""
         try:
-            if self.ws_client:
-                self.ws_client.close()
-                self.ws_client = None
-                logger.info("WebSocket 連接已關閉")
-            
-            if self.listen_key:
-                try:
-                    self.client.close_listen_key(listenKey=self.listen_key)
-                    logger.info("ListenKey 已關閉")
-                except Exception as e:
-                    logger.warning(f"關閉 ListenKey 失敗: {str(e)}")
+            # 先發出累積中的批次訂單，此時 REST 客戶端仍可用，等待結果的調用方不會卡住
+            self._stop_batch_flusher()
+            
+            # 避免關閉連接時觸發重連
+            self._ws_stop.set()
+            self._keepalive_stop.set()
+            
+            # 關閉 WebSocket、關閉 listenKey 與等待保活線程結束互不依賴，並行執行
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                futures = {}
+                if self.ws_client:
+                    futures[executor.submit(self.ws_client.close)] = (
+                        "WebSocket 連接已關閉", "關閉 WebSocket 連接失敗: %s")
+                if self.listen_key:
+                    futures[executor.submit(self.client.close_listen_key, listenKey=self.listen_key)] = (
+                        "ListenKey 已關閉", "關閉 ListenKey 失敗: %s")
+                if self._keepalive_thread:
+                    futures[executor.submit(self._keepalive_thread.join, 5)] = (
+                        "ListenKey 保活任務已停止", "停止 ListenKey 保活任務失敗: %s")
+                for future in as_completed(futures):
+                    success_msg, error_msg = futures[future]
+                    try:
+                        future.result()
+                        logger.info(success_msg)
+                    except Exception as e:
+                        logger.warning(error_msg, e)
             
+            self.ws_client = None
             self.listen_key = None
+            self._keepalive_thread = None
             
-            if self._keepalive_thread:
-                self._keepalive_thread.join(timeout=5)
-                self._keepalive_thread = None
-                logger.info("ListenKey 保活任務已停止")
+            self._stop_message_worker()
+            self._stop_log_listener()
         except Exception as e:
-            logger.error(f"關閉 API 連接時發生錯誤: {str(e)}")
+            logger.error("關閉 API 連接時發生錯誤: %s", e)
             raise
@@ -1,16 +1,311 @@
-from typing import Dict, Optional, Union
+from typing import Dict, List, Optional, Union
+from collections.abc import Sequence
+from operator import itemgetter
+from functools import lru_cache
+from sys import intern
 from decimal import Decimal
 import logging
-from .data_models import Order, OrderResult, PositionInfo, AccountInfo
+from .data_models import Order, OrderResult, PositionInfo, AccountInfo, AssetInfo, AccountPosition
 from .enums import (
     OrderSide, OrderType, OrderStatus, TimeInForce, WorkingType,
     PositionSide, PriceMatch, SelfTradePreventionMode, PositionStatus, CloseReason
 )
-from datetime import datetime
 import time
 
 logger = logging.getLogger(__name__)
 
+# 倉位字段提取器，字段順序與 PositionInfo 構造參數一致
+_WS_POSITION_FIELDS = itemgetter(
+    's', 'ps', 'pa', 'ep', 'bep', 'mp', 'up', 'lp', 'im', 'n', 'ma',
+    'iw', 'im', 'mm', 'pim', 'oim', 'adl', 'bn', 'an', 't'
+)
+_REST_POSITION_FIELDS = itemgetter(
+    'symbol', 'positionSide', 'positionAmt', 'entryPrice', 'breakEvenPrice', 'markPrice',
+    'unRealizedProfit', 'liquidationPrice', 'isolatedMargin', 'notional', 'marginAsset',
+    'isolatedWallet', 'initialMargin', 'maintMargin', 'positionInitialMargin',
+    'openOrderInitialMargin', 'adl', 'bidNotional', 'askNotional', 'updateTime'
+)
+
+# 倉位字段缺失時的預設值
+_WS_POSITION_DEFAULTS = {
+    's': '', 'ps': 'BOTH', 'pa': '0', 'ep': '0', 'bep': '0', 'mp': '0', 'up': '0',
+    'lp': '0', 'im': '0', 'n': '0', 'ma': 'USDT', 'iw': '0', 'mm': '0', 'pim': '0',
+    'oim': '0', 'adl': 0, 'bn': '0', 'an': '0', 't': 0
+}
+_REST_POSITION_DEFAULTS = {
+    'symbol': '', 'positionSide': 'BOTH', 'positionAmt': '0', 'entryPrice': '0',
+    'breakEvenPrice': '0', 'markPrice': '0', 'unRealizedProfit': '0', 'liquidationPrice': '0',
+    'isolatedMargin': '0', 'notional': '0', 'marginAsset': 'USDT', 'isolatedWallet': '0',
+    'initialMargin': '0', 'maintMargin': '0', 'positionInitialMargin': '0',
+    'openOrderInitialMargin': '0', 'adl': 0, 'bidNotional': '0', 'askNotional': '0',
+    'updateTime': 0
+}
+
+# 帳戶資產及倉位字段缺失時的預設值
+_ASSET_DEFAULTS = {
+    'asset': '', 'walletBalance': '0', 'unrealizedProfit': '0', 'marginBalance': '0',
+    'maintMargin': '0', 'initialMargin': '0', 'positionInitialMargin': '0',
+    'openOrderInitialMargin': '0', 'crossWalletBalance': '0', 'crossUnPnl': '0',
+    'availableBalance': '0', 'maxWithdrawAmount': '0', 'marginAvailable': False
+}
+_ACCOUNT_POSITION_DEFAULTS = {
+    'symbol': '', 'initialMargin': '0', 'maintMargin': '0', 'unrealizedProfit': '0',
+    'positionInitialMargin': '0', 'openOrderInitialMargin': '0', 'leverage': 1,
+    'isolated': False, 'entryPrice': '0', 'maxNotional': '0', 'positionSide': 'BOTH',
+    'positionAmt': '0', 'notional': '0', 'isolatedWallet': '0'
+}
+
+def _make_position(fields: tuple) -> PositionInfo:
+    """由按 PositionInfo 字段順序排列的原始值構造倉位對象，REST 與 WebSocket 格式共用"""
+    (symbol, position_side, position_amt, entry_price, break_even_price, mark_price,
+     un_realized_profit, liquidation_price, isolated_margin, notional, margin_asset,
+     isolated_wallet, initial_margin, maint_margin, position_initial_margin,
+     open_order_initial_margin, adl, bid_notional, ask_notional, update_time) = fields
+    
+    # 交易對等重複出現的字串經 intern 共享同一對象，比較時只需比對指針
+    # Binance 的數值字段本身即為字串，經緩存構造 Decimal；其他類型先轉為字串，避免浮點數的二進制誤差
+    # （綁定為局部變量以減少全局查找）
+    # 按字段順序以位置參數構造，省去關鍵字參數綁定
+    D = _decimal
+    return PositionInfo(
+        intern(symbol),
+        intern(position_side),
+        D(position_amt),
+        D(entry_price),
+        D(break_even_price),
+        D(mark_price),
+        D(un_realized_profit),
+        D(liquidation_price),
+        D(isolated_margin),
+        D(notional),
+        intern(margin_asset),
+        D(isolated_wallet),
+        D(initial_margin),
+        D(maint_margin),
+        D(position_initial_margin),
+        D(open_order_initial_margin),
+        int(adl),
+        D(bid_notional),
+        D(ask_notional),
+        int(update_time)
+    )
+
+
+def _position_from_rest(position: Dict) -> PositionInfo:
+    """將 REST API 格式的倉位數據轉換為 PositionInfo 對象"""
+    return _make_position(_REST_POSITION_FIELDS({**_REST_POSITION_DEFAULTS, **position}))
+
+
+def _position_from_stream(position: Dict) -> PositionInfo:
+    """將 WebSocket ACCOUNT_UPDATE 中的單個倉位數據轉換為 PositionInfo 對象"""
+    return _make_position(_WS_POSITION_FIELDS({**_WS_POSITION_DEFAULTS, **position}))
+
+
+@lru_cache(maxsize=4096)
+def to_decimal(value: str) -> Decimal:
+    """將數值字串轉換為 Decimal 並緩存結果
+    
+    價格與數量都落在固定的最小變動單位上，同一交易時段內重複出現的字串很多；
+    Decimal 為不可變對象，可安全共享
+    """
+    return Decimal(value)
+
+
+def _decimal(value) -> Decimal:
+    """轉換為 Decimal（Binance 返回的數值本身即為字串，無需再經 str()；已是 Decimal 則原樣返回）"""
+    cls = value.__class__
+    if cls is str:
+        return to_decimal(value)
+    if cls is Decimal:
+        return value
+    return to_decimal(str(value))
+
+
+_DECIMAL_ZERO = Decimal('0')
+
+
+def _decimal_unless_zero(value) -> Optional[Decimal]:
+    """轉換為 Decimal，值為 '0' 時返回 None（字段缺失時視為 0）"""
+    if value == '0':
+        return None
+    if value is None:
+        return _DECIMAL_ZERO
+    return _decimal(value)
+
+
+def _decimal_if_set(value) -> Optional[Decimal]:
+    """值非空時轉換為 Decimal，否則返回 None"""
+    return _decimal(value) if value else None
+
+
+def _extract_fields(data: Dict, table: tuple) -> Dict:
+    """按字段表從原始數據中提取並轉換各字段
+    
+    Args:
+        data: Binance API 返回的原始數據
+        table: (屬性名, 原始字段名, 預設值, 轉換函數) 組成的字段表，轉換函數為 None 時保留原值
+        
+    Returns:
+        Dict: 可直接用於構造數據類的關鍵字參數
+    """
+    get = data.get
+    return {
+        attr: get(key, default) if convert is None else convert(get(key, default))
+        for attr, key, default, convert in table
+    }
+
+
+# 枚舉名稱到成員的查找表，以普通 dict 取值，省去 EnumMeta.__getitem__ 的開銷
+_ORDER_SIDES = dict(OrderSide.__members__)
+_ORDER_TYPES = dict(OrderType.__members__)
+_TIME_IN_FORCES = dict(TimeInForce.__members__)
+_WORKING_TYPES = dict(WorkingType.__members__)
+_POSITION_SIDES = dict(PositionSide.__members__)
+_PRICE_MATCHES = dict(PriceMatch.__members__)
+_STP_MODES = dict(SelfTradePreventionMode.__members__)
+_ORDER_STATUSES = dict(OrderStatus.__members__)
+
+# 訂單字段表 (屬性名, 原始字段名, 預設值, 轉換函數)
+_WS_ORDER_FIELDS = (
+    ('symbol', 's', '', intern),
+    ('side', 'S', 'BUY', _ORDER_SIDES.__getitem__),
+    ('type', 'o', 'MARKET', _ORDER_TYPES.__getitem__),
+    ('quantity', 'q', 0, _decimal),
+    ('price', 'p', None, _decimal_unless_zero),
+    ('stop_price', 'sp', None, _decimal_unless_zero),
+    ('time_in_force', 'f', 'GTC', _TIME_IN_FORCES.__getitem__),
+    ('order_id', 'i', 0, None),
+    ('client_order_id', 'c', '', None),
+    ('reduce_only', 'R', False, None),
+    ('close_position', 'cp', False, None),
+    ('working_type', 'wt', 'CONTRACT_PRICE', _WORKING_TYPES.__getitem__),
+    ('price_protect', 'pP', False, None),
+    ('activate_price', 'AP', None, _decimal_if_set),
+    ('price_rate', 'cr', None, _decimal_if_set),
+    ('position_side', 'ps', 'BOTH', _POSITION_SIDES.__getitem__),
+    ('orig_type', 'ot', 'MARKET', _ORDER_TYPES.__getitem__),
+    ('price_match', 'pm', 'NONE', _PRICE_MATCHES.__getitem__),
+    ('self_trade_prevention_mode', 'stpm', 'NONE', _STP_MODES.__getitem__),
+    ('good_till_date', 'gtd', 0, int),
+    ('avg_price', 'ap', None, _decimal_unless_zero),
+    ('last_filled_qty', 'l', None, _decimal_unless_zero),
+    ('executed_qty', 'z', None, _decimal_unless_zero),
+    ('realized_profit', 'rp', None, _decimal_unless_zero),
+    ('status', 'X', 'NEW', _ORDER_STATUSES.__getitem__),
+    ('execution_type', 'x', 'NEW', intern),
+)
+_REST_ORDER_FIELDS = (
+    ('symbol', 'symbol', '', intern),
+    ('side', 'side', 'BUY', _ORDER_SIDES.__getitem__),
+    ('type', 'type', 'MARKET', _ORDER_TYPES.__getitem__),
+    ('quantity', 'quantity', 0, _decimal),
+    ('price', 'price', None, _decimal_unless_zero),
+    ('stop_price', 'stopPrice', None, _decimal_unless_zero),
+    ('time_in_force', 'timeInForce', 'GTC', _TIME_IN_FORCES.__getitem__),
+    ('order_id', 'orderId', 0, None),
+    ('client_order_id', 'clientOrderId', '', None),
+    ('reduce_only', 'reduceOnly', False, None),
+    ('close_position', 'closePosition', False, None),
+    ('working_type', 'workingType', 'CONTRACT_PRICE', _WORKING_TYPES.__getitem__),
+    ('price_protect', 'priceProtect', False, None),
+    ('activate_price', 'activatePrice', None, _decimal_if_set),
+    ('price_rate', 'priceRate', None, _decimal_if_set),
+    ('position_side', 'positionSide', 'BOTH', _POSITION_SIDES.__getitem__),
+    ('orig_type', 'origType', 'MARKET', _ORDER_TYPES.__getitem__),
+    ('price_match', 'priceMatch', 'NONE', _PRICE_MATCHES.__getitem__),
+    ('self_trade_prevention_mode', 'selfTradePreventionMode', 'NONE', _STP_MODES.__getitem__),
+    ('good_till_date', 'goodTillDate', 0, int),
+)
+_ORDER_RESULT_FIELDS = (
+    ('order_id', 'orderId', 0, None),
+    ('symbol', 'symbol', '', intern),
+    ('status', 'status', 'NEW', _ORDER_STATUSES.__getitem__),
+    ('client_order_id', 'clientOrderId', '', None),
+    ('price', 'price', None, _decimal_unless_zero),
+    ('avg_price', 'avgPrice', None, _decimal_unless_zero),
+    ('orig_qty', 'origQty', 0, _decimal),
+    ('executed_qty', 'executedQty', 0, _decimal),
+    ('cum_quote', 'cumQuote', 0, _decimal),
+    ('time_in_force', 'timeInForce', 'GTC', _TIME_IN_FORCES.__getitem__),
+    ('type', 'type', 'MARKET', _ORDER_TYPES.__getitem__),
+    ('reduce_only', 'reduceOnly', False, None),
+    ('close_position', 'closePosition', False, None),
+    ('side', 'side', 'BUY', _ORDER_SIDES.__getitem__),
+    ('position_side', 'positionSide', 'BOTH', _POSITION_SIDES.__getitem__),
+    ('stop_price', 'stopPrice', None, _decimal_unless_zero),
+    ('working_type', 'workingType', 'CONTRACT_PRICE', _WORKING_TYPES.__getitem__),
+    ('price_protect', 'priceProtect', False, None),
+    ('orig_type', 'origType', '', intern),
+    ('update_time', 'updateTime', 0, None),
+    ('activate_price', 'activatePrice', None, _decimal_if_set),
+    ('price_rate', 'priceRate', None, _decimal_if_set),
+    ('time', 'time', 0, None),
+    ('working_time', 'workingTime', 0, None),
+    ('self_trade_prevention_mode', 'selfTradePreventionMode', 'NONE', _STP_MODES.__getitem__),
+    ('good_till_date', 'goodTillDate', 0, int),
+    ('price_match', 'priceMatch', 'NONE', _PRICE_MATCHES.__getitem__),
+    ('cancel_restrictions', 'cancelRestrictions', '', None),
+    ('prevented_match_id', 'preventedMatchId', 0, None),
+    ('prevented_quantity', 'preventedQuantity', None, _decimal_if_set),
+    ('is_working', 'isWorking', True, None),
+)
+
+# 原始訂單類型到平倉原因的查找表；OrderType 為字串枚舉，Order 的枚舉值與 OrderResult 的字串皆可直接查
+_CLOSE_REASONS = {
+    OrderType.TAKE_PROFIT_MARKET: CloseReason.TAKE_PROFIT.value,
+    OrderType.STOP_MARKET: CloseReason.STOP_LOSS.value,
+    OrderType.TRAILING_STOP_MARKET: CloseReason.TRAILING_STOP.value,
+    OrderType.TAKE_PROFIT: CloseReason.TAKE_PROFIT.value,
+    OrderType.STOP: CloseReason.STOP_LOSS.value,
+    OrderType.LIQUIDATION: CloseReason.LIQUIDATION.value,
+}
+_MANUAL_CLOSE = CloseReason.MANUAL.value
+
+
+def _build_asset(asset: Dict, update_time: int) -> AssetInfo:
+    """將帳戶資產數據轉換為 AssetInfo 對象"""
+    asset = {**_ASSET_DEFAULTS, **asset}
+    D = _decimal
+    return AssetInfo(
+        asset=intern(asset['asset']),
+        wallet_balance=D(asset['walletBalance']),
+        unrealized_profit=D(asset['unrealizedProfit']),
+        margin_balance=D(asset['marginBalance']),
+        maint_margin=D(asset['maintMargin']),
+        initial_margin=D(asset['initialMargin']),
+        position_initial_margin=D(asset['positionInitialMargin']),
+        open_order_initial_margin=D(asset['openOrderInitialMargin']),
+        cross_wallet_balance=D(asset['crossWalletBalance']),
+        cross_un_pnl=D(asset['crossUnPnl']),
+        available_balance=D(asset['availableBalance']),
+        max_withdraw_amount=D(asset['maxWithdrawAmount']),
+        margin_available=bool(asset['marginAvailable']),
+        update_time=update_time
+    )
+
+
+def _build_account_position(position: Dict, update_time: int) -> AccountPosition:
+    """將帳戶倉位數據轉換為 AccountPosition 對象"""
+    position = {**_ACCOUNT_POSITION_DEFAULTS, **position}
+    D = _decimal
+    return AccountPosition(
+        symbol=intern(position['symbol']),
+        initial_margin=D(position['initialMargin']),
+        maint_margin=D(position['maintMargin']),
+        unrealized_profit=D(position['unrealizedProfit']),
+        position_initial_margin=D(position['positionInitialMargin']),
+        open_order_initial_margin=D(position['openOrderInitialMargin']),
+        leverage=int(position['leverage']),
+        isolated=bool(position['isolated']),
+        entry_price=D(position['entryPrice']),
+        max_notional=D(position['maxNotional']),
+        position_side=position['positionSide'],
+        position_amt=D(position['positionAmt']),
+        notional=D(position['notional']),
+        isolated_wallet=D(position['isolatedWallet']),
+        update_time=update_time
+    )
+
 class BinanceConverter:
     """Binance API 數據轉換器"""
     
@@ -21,70 +316,48 @@ class BinanceConverter:
         Args:
             order_data: Binance API 返回的訂單數據，可以是 REST API 或 WebSocket 格式
             
+        Returns:
+            Order: 轉換後的 Order 對象
+        """
+        # 檢查是否為 WebSocket 格式（包含 'o' 字段）
+        if isinstance(order_data, dict) and 'o' in order_data and 'T' in order_data:
+            return BinanceConverter.stream_to_order(order_data['o'], order_data['T'])
+        # REST API 格式使用完整字段名
+        return BinanceConverter.rest_to_order(order_data)
+        
+    @staticmethod
+    def rest_to_order(order_data: Dict) -> Order:
+        """將 REST API 返回的訂單數據轉換為 Order 對象，已知數據格式時直接調用，省去格式判斷
+        
+        Args:
+            order_data: REST API 返回的訂單數據
+            
         Returns:
             Order: 轉換後的 Order 對象
         """
         try:
-            # 檢查是否為 WebSocket 格式（包含 'o' 字段）
-            if isinstance(order_data, dict) and 'o' in order_data and 'T' in order_data:
-                # 如果是 WebSocket 消息，提取訂單數據
-                transaction_time = order_data['T']
-                order_data = order_data['o']
-                return Order(
-                    symbol=order_data.get('s', ''),
-                    side=OrderSide[order_data.get('S', 'BUY')],
-                    type=OrderType[order_data.get('o', 'MARKET')],
-                    quantity=Decimal(str(order_data.get('q', 0))),
-                    price=Decimal(str(order_data.get('p', 0))) if order_data.get('p') != '0' else None,
-                    stop_price=Decimal(str(order_data.get('sp', 0))) if order_data.get('sp') != '0' else None,
-                    time_in_force=TimeInForce[order_data.get('f', 'GTC')],
-                    order_id=order_data.get('i', 0),
-                    client_order_id=order_data.get('c', ''),
-                    reduce_only=order_data.get('R', False),
-                    close_position=order_data.get('cp', False),
-                    working_type=WorkingType[order_data.get('wt', 'CONTRACT_PRICE')],
-                    price_protect=order_data.get('pP', False),
-                    activate_price=Decimal(str(order_data.get('AP', 0))) if order_data.get('AP') else None,
-                    price_rate=Decimal(str(order_data.get('cr', 0))) if order_data.get('cr') else None,
-                    position_side=PositionSide[order_data.get('ps', 'BOTH')],
-                    orig_type=OrderType[order_data.get('ot', 'MARKET')],
-                    price_match=PriceMatch[order_data.get('pm', 'NONE')],
-                    self_trade_prevention_mode=SelfTradePreventionMode[order_data.get('stpm', 'NONE')],
-                    good_till_date=int(order_data.get('gtd', 0)),
-                    avg_price=Decimal(str(order_data.get('ap', 0))) if order_data.get('ap') != '0' else None,
-                    last_filled_qty=Decimal(str(order_data.get('l', 0))) if order_data.get('l') != '0' else None,
-                    executed_qty=Decimal(str(order_data.get('z', 0))) if order_data.get('z') != '0' else None,
-                    realized_profit=Decimal(str(order_data.get('rp', 0))) if order_data.get('rp') != '0' else None,
-                    status=OrderStatus[order_data.get('X', 'NEW')],
-                    execution_type=order_data.get('x', 'NEW'),
-                    timestamp=int(transaction_time)
-                )
-            else:
-                # REST API 格式使用完整字段名
-                return Order(
-                    symbol=order_data.get('symbol', ''),
-                    side=OrderSide[order_data.get('side', 'BUY')],
-                    type=OrderType[order_data.get('type', 'MARKET')],
-                    quantity=Decimal(str(order_data.get('quantity', 0))),
-                    price=Decimal(str(order_data.get('price', 0))) if order_data.get('price') != '0' else None,
-                    stop_price=Decimal(str(order_data.get('stopPrice', 0))) if order_data.get('stopPrice') != '0' else None,
-                    time_in_force=TimeInForce[order_data.get('timeInForce', 'GTC')],
-                    order_id=order_data.get('orderId', 0),
-                    client_order_id=order_data.get('clientOrderId', ''),
-                    reduce_only=order_data.get('reduceOnly', False),
-                    close_position=order_data.get('closePosition', False),
-                    working_type=WorkingType[order_data.get('workingType', 'CONTRACT_PRICE')],
-                    price_protect=order_data.get('priceProtect', False),
-                    activate_price=Decimal(str(order_data.get('activatePrice', 0))) if order_data.get('activatePrice') else None,
-                    price_rate=Decimal(str(order_data.get('priceRate', 0))) if order_data.get('priceRate') else None,
-                    position_side=PositionSide[order_data.get('positionSide', 'BOTH')],
-                    orig_type=OrderType[order_data.get('origType', 'MARKET')],
-                    price_match=PriceMatch[order_data.get('priceMatch', 'NONE')],
-                    self_trade_prevention_mode=SelfTradePreventionMode[order_data.get('selfTradePreventionMode', 'NONE')],
-                    good_till_date=int(order_data.get('goodTillDate', 0))
-                )
+            return Order(**_extract_fields(order_data, _REST_ORDER_FIELDS))
         except Exception as e:
-            logger.error(f"轉換訂單數據失敗: {str(e)}")
+            logger.error("轉換訂單數據失敗: %s", e)
+            raise
+            
+    @staticmethod
+    def stream_to_order(order_data: Dict, transaction_time: int) -> Order:
+        """將 ORDER_TRADE_UPDATE 事件中的訂單數據（'o' 字段）轉換為 Order 對象
+        
+        Args:
+            order_data: 事件中的訂單數據
+            transaction_time: 事件的撮合時間（'T' 字段）
+            
+        Returns:
+            Order: 轉換後的 Order 對象
+        """
+        try:
+            fields = _extract_fields(order_data, _WS_ORDER_FIELDS)
+            fields['timestamp'] = int(transaction_time)
+            return Order(**fields)
+        except Exception as e:
+            logger.error("轉換訂單數據失敗: %s", e)
             raise
 
     @staticmethod
@@ -99,44 +372,12 @@ class BinanceConverter:
         """
         try:
             # 如果已經是 OrderResult 對象，直接返回
-            if isinstance(response, OrderResult):
+            if response.__class__ is OrderResult:
                 return response
                 
-            return OrderResult(
-                order_id=response.get('orderId', 0),
-                symbol=response.get('symbol', ''),
-                status=OrderStatus[response.get('status', 'NEW')],
-                client_order_id=response.get('clientOrderId', ''),
-                price=Decimal(str(response.get('price', 0))) if response.get('price') != '0' else None,
-                avg_price=Decimal(str(response.get('avgPrice', 0))) if response.get('avgPrice') != '0' else None,
-                orig_qty=Decimal(str(response.get('origQty', 0))),
-                executed_qty=Decimal(str(response.get('executedQty', 0))),
-                cum_quote=Decimal(str(response.get('cumQuote', 0))),
-                time_in_force=TimeInForce[response.get('timeInForce', 'GTC')],
-                type=OrderType[response.get('type', 'MARKET')],
-                reduce_only=response.get('reduceOnly', False),
-                close_position=response.get('closePosition', False),
-                side=OrderSide[response.get('side', 'BUY')],
-                position_side=PositionSide[response.get('positionSide', 'BOTH')],
-                stop_price=Decimal(str(response.get('stopPrice', 0))) if response.get('stopPrice') != '0' else None,
-                working_type=WorkingType[response.get('workingType', 'CONTRACT_PRICE')],
-                price_protect=response.get('priceProtect', False),
-                orig_type=response.get('origType', ''),
-                update_time=response.get('updateTime', 0),
-                activate_price=Decimal(str(response.get('activatePrice', 0))) if response.get('activatePrice') else None,
-                price_rate=Decimal(str(response.get('priceRate', 0))) if response.get('priceRate') else None,
-                time=response.get('time', 0),
-                working_time=response.get('workingTime', 0),
-                self_trade_prevention_mode=SelfTradePreventionMode[response.get('selfTradePreventionMode', 'NONE')],
-                good_till_date=int(response.get('goodTillDate', 0)),
-                price_match=PriceMatch[response.get('priceMatch', 'NONE')],
-                cancel_restrictions=response.get('cancelRestrictions', ''),
-                prevented_match_id=response.get('preventedMatchId', 0),
-                prevented_quantity=Decimal(str(response.get('preventedQuantity', 0))) if response.get('preventedQuantity') else None,
-                is_working=response.get('isWorking', True)
-            )
+            return OrderResult(**_extract_fields(response, _ORDER_RESULT_FIELDS))
         except Exception as e:
-            logger.error(f"轉換訂單結果失敗: {str(e)}")
+            logger.error("轉換訂單結果失敗: %s", e)
             raise
 
     @staticmethod
@@ -151,56 +392,32 @@ class BinanceConverter:
         """
         try:
             # 檢查是否為 WebSocket 格式
-            if 'e' in position_data and position_data['e'] == 'ACCOUNT_UPDATE':
-                position = position_data.get('a', {}).get('P', [{}])[0]
-                return PositionInfo(
-                    symbol=position.get('s', ''),
-                    position_side=position.get('ps', 'BOTH'),
-                    position_amt=Decimal(str(position.get('pa', 0))),
-                    entry_price=Decimal(str(position.get('ep', 0))),
-                    break_even_price=Decimal(str(position.get('bep', 0))),
-                    mark_price=Decimal(str(position.get('mp', 0))),
-                    un_realized_profit=Decimal(str(position.get('up', 0))),
-                    liquidation_price=Decimal(str(position.get('lp', 0))),
-                    isolated_margin=Decimal(str(position.get('im', 0))),
-                    notional=Decimal(str(position.get('n', 0))),
-                    margin_asset=position.get('ma', 'USDT'),
-                    isolated_wallet=Decimal(str(position.get('iw', 0))),
-                    initial_margin=Decimal(str(position.get('im', 0))),
-                    maint_margin=Decimal(str(position.get('mm', 0))),
-                    position_initial_margin=Decimal(str(position.get('pim', 0))),
-                    open_order_initial_margin=Decimal(str(position.get('oim', 0))),
-                    adl=int(position.get('adl', 0)),
-                    bid_notional=Decimal(str(position.get('bn', 0))),
-                    ask_notional=Decimal(str(position.get('an', 0))),
-                    update_time=int(position.get('t', 0))
-                )
-            else:
-                # REST API 格式
-                return PositionInfo(
-                    symbol=position_data.get('symbol', ''),
-                    position_side=position_data.get('positionSide', 'BOTH'),
-                    position_amt=Decimal(str(position_data.get('positionAmt', 0))),
-                    entry_price=Decimal(str(position_data.get('entryPrice', 0))),
-                    break_even_price=Decimal(str(position_data.get('breakEvenPrice', 0))),
-                    mark_price=Decimal(str(position_data.get('markPrice', 0))),
-                    un_realized_profit=Decimal(str(position_data.get('unRealizedProfit', 0))),
-                    liquidation_price=Decimal(str(position_data.get('liquidationPrice', 0))),
-                    isolated_margin=Decimal(str(position_data.get('isolatedMargin', 0))),
-                    notional=Decimal(str(position_data.get('notional', 0))),
-                    margin_asset=position_data.get('marginAsset', 'USDT'),
-                    isolated_wallet=Decimal(str(position_data.get('isolatedWallet', 0))),
-                    initial_margin=Decimal(str(position_data.get('initialMargin', 0))),
-                    maint_margin=Decimal(str(position_data.get('maintMargin', 0))),
-                    position_initial_margin=Decimal(str(position_data.get('positionInitialMargin', 0))),
-                    open_order_initial_margin=Decimal(str(position_data.get('openOrderInitialMargin', 0))),
-                    adl=int(position_data.get('adl', 0)),
-                    bid_notional=Decimal(str(position_data.get('bidNotional', 0))),
-                    ask_notional=Decimal(str(position_data.get('askNotional', 0))),
-                    update_time=int(position_data.get('updateTime', 0))
-                )
+            if position_data.get('e') == 'ACCOUNT_UPDATE':
+                return _position_from_stream(position_data.get('a', {}).get('P', [{}])[0])
+            # REST API 格式
+            return _position_from_rest(position_data)
+        except Exception as e:
+            logger.error("轉換倉位數據失敗: %s", e)
+            raise
+
+    @staticmethod
+    def to_positions(account_update: Dict) -> List[PositionInfo]:
+        """將 ACCOUNT_UPDATE 事件中的所有倉位數據轉換為 PositionInfo 對象列表
+        
+        Args:
+            account_update: WebSocket 推送的 ACCOUNT_UPDATE 事件
+            
+        Returns:
+            List[PositionInfo]: 轉換後的倉位列表，事件中沒有倉位時返回空列表
+        """
+        try:
+            return [
+                _position_from_stream(position)
+                for position in account_update.get('a', {}).get('P', ())
+                if position
+            ]
         except Exception as e:
-            logger.error(f"轉換倉位數據失敗: {str(e)}")
+            logger.error("轉換倉位數據失敗: %s", e)
             raise
 
     @staticmethod
@@ -214,26 +431,11 @@ class BinanceConverter:
             str: 平倉原因，如果沒有則返回 None
         """
         try:
-            # 根據原始訂單類型判斷
-            if order.orig_type:
-                if order.orig_type == OrderType.TAKE_PROFIT_MARKET:
-                    return CloseReason.TAKE_PROFIT.value
-                elif order.orig_type == OrderType.STOP_MARKET:
-                    return CloseReason.STOP_LOSS.value
-                elif order.orig_type == OrderType.TRAILING_STOP_MARKET:
-                    return CloseReason.TRAILING_STOP.value
-                elif order.orig_type == OrderType.TAKE_PROFIT:
-                    return CloseReason.TAKE_PROFIT.value
-                elif order.orig_type == OrderType.STOP:
-                    return CloseReason.STOP_LOSS.value
-                elif order.orig_type == OrderType.LIQUIDATION:
-                    return CloseReason.LIQUIDATION.value
-            
-            # 如果都無法判斷，則返回手動平倉
-            return CloseReason.MANUAL.value
+            # 根據原始訂單類型查表，無法判斷時返回手動平倉
+            return _CLOSE_REASONS.get(order.orig_type, _MANUAL_CLOSE)
             
         except Exception as e:
-            logger.error(f"獲取平倉原因失敗: {str(e)}")
+            logger.error("獲取平倉原因失敗: %s", e)
             return None
 
     @staticmethod
@@ -246,50 +448,54 @@ class BinanceConverter:
         Returns:
             AccountInfo: 轉換後的帳戶信息對象
         """
+        # 同一快照內的資產與倉位共用一個時間戳
+        update_time = int(time.time() * 1000)
+        get = account_data.get
+        D = _decimal
         return AccountInfo(
-            total_wallet_balance=Decimal(str(account_data.get('totalWalletBalance', 0))),
-            total_unrealized_profit=Decimal(str(account_data.get('totalUnrealizedProfit', 0))),
-            total_margin_balance=Decimal(str(account_data.get('totalMarginBalance', 0))),
-            total_position_initial_margin=Decimal(str(account_data.get('totalPositionInitialMargin', 0))),
-            total_open_order_initial_margin=Decimal(str(account_data.get('totalOpenOrderInitialMargin', 0))),
-            total_cross_wallet_balance=Decimal(str(account_data.get('totalCrossWalletBalance', 0))),
-            available_balance=Decimal(str(account_data.get('availableBalance', 0))),
-            max_withdraw_amount=Decimal(str(account_data.get('maxWithdrawAmount', 0))),
-            total_initial_margin=Decimal(str(account_data.get('totalInitialMargin', 0))),
-            total_maint_margin=Decimal(str(account_data.get('totalMaintMargin', 0))),
-            total_cross_un_pnl=Decimal(str(account_data.get('totalCrossUnPnl', 0))),
-            assets=[{
-                'asset': asset.get('asset', ''),
-                'wallet_balance': Decimal(str(asset.get('walletBalance', 0))),
-                'unrealized_profit': Decimal(str(asset.get('unrealizedProfit', 0))),
-                'margin_balance': Decimal(str(asset.get('marginBalance', 0))),
-                'maint_margin': Decimal(str(asset.get('maintMargin', 0))),
-                'initial_margin': Decimal(str(asset.get('initialMargin', 0))),
-                'position_initial_margin': Decimal(str(asset.get('positionInitialMargin', 0))),
-                'open_order_initial_margin': Decimal(str(asset.get('openOrderInitialMargin', 0))),
-                'cross_wallet_balance': Decimal(str(asset.get('crossWalletBalance', 0))),
-                'cross_un_pnl': Decimal(str(asset.get('crossUnPnl', 0))),
-                'available_balance': Decimal(str(asset.get('availableBalance', 0))),
-                'max_withdraw_amount': Decimal(str(asset.get('maxWithdrawAmount', 0))),
-                'margin_available': bool(asset.get('marginAvailable', False)),
-                'update_time': int(time.time() * 1000)
-            } for asset in account_data.get('assets', [])],
-            positions=[{
-                'symbol': position.get('symbol', ''),
-                'initial_margin': Decimal(str(position.get('initialMargin', 0))),
-                'maint_margin': Decimal(str(position.get('maintMargin', 0))),
-                'unrealized_profit': Decimal(str(position.get('unrealizedProfit', 0))),
-                'position_initial_margin': Decimal(str(position.get('positionInitialMargin', 0))),
-                'open_order_initial_margin': Decimal(str(position.get('openOrderInitialMargin', 0))),
-                'leverage': int(position.get('leverage', 1)),
-                'isolated': bool(position.get('isolated', False)),
-                'entry_price': Decimal(str(position.get('entryPrice', 0))),
-                'max_notional': Decimal(str(position.get('maxNotional', 0))),
-                'position_side': position.get('positionSide', 'BOTH'),
-                'position_amt': Decimal(str(position.get('positionAmt', 0))),
-                'notional': Decimal(str(position.get('notional', 0))),
-                'isolated_wallet': Decimal(str(position.get('isolatedWallet', 0))),
-                'update_time': int(time.time() * 1000)
-            } for position in account_data.get('positions', [])],
-            update_time=int(time.time() * 1000)
+            total_wallet_balance=D(get('totalWalletBalance', '0')),
+            total_unrealized_profit=D(get('totalUnrealizedProfit', '0')),
+            total_margin_balance=D(get('totalMarginBalance', '0')),
+            total_position_initial_margin=D(get('totalPositionInitialMargin', '0')),
+            total_open_order_initial_margin=D(get('totalOpenOrderInitialMargin', '0')),
+            total_cross_wallet_balance=D(get('totalCrossWalletBalance', '0')),
+            available_balance=D(get('availableBalance', '0')),
+            max_withdraw_amount=D(get('maxWithdrawAmount', '0')),
+            total_initial_margin=D(get('totalInitialMargin', '0')),
+            total_maint_margin=D(get('totalMaintMargin', '0')),
+            total_cross_un_pnl=D(get('totalCrossUnPnl', '0')),
+            assets=[_build_asset(asset, update_time) for asset in account_data.get('assets', ())],
+            positions=[_build_account_position(position, update_time) for position in account_data.get('positions', ())],
+            update_time=update_time
         )
+
+
+class LazyOrders(Sequence):
+    """延遲轉換的訂單序列
+    
+    保存 Binance API 返回的原始訂單數據，只在元素被訪問時才轉換為 Order 對象，
+    只關心數量的調用方無需承擔轉換成本
+    """
+    
+    def __init__(self, raw_orders: List[Dict]):
+        """
+        Args:
+            raw_orders: Binance API 返回的原始訂單數據列表
+        """
+        self._raw_orders = raw_orders
+        self._orders: List[Optional[Order]] = [None] * len(raw_orders)
+        
+    def __len__(self) -> int:
+        return len(self._raw_orders)
+        
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        order = self._orders[index]
+        if order is None:
+            order = BinanceConverter.rest_to_order(self._raw_orders[index])
+            self._orders[index] = order
+        return order
+        
+    def __repr__(self) -> str:
+        return repr(list(self))
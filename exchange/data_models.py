@@ -5,10 +5,11 @@ from .enums import (
     TimeInForce, WorkingType, PositionSide, PriceMatch, 
     SelfTradePreventionMode, NewOrderRespType
 )
+from ._compat import SLOTS
 from datetime import datetime
 from decimal import Decimal
 
-@dataclass
+@dataclass(**SLOTS)
 class AssetInfo:
     """資產信息數據類
     
@@ -40,10 +41,10 @@ class AssetInfo:
     cross_un_pnl: Decimal
     available_balance: Decimal
     max_withdraw_amount: Decimal
-    margin_available: Decimal
+    margin_available: bool
     update_time: int
 
-@dataclass
+@dataclass(**SLOTS)
 class OrderBase:
     """訂單基礎類，包含所有必需字段
     
@@ -58,7 +59,7 @@ class OrderBase:
     type: OrderType
     quantity: Optional[Decimal] = None
 
-@dataclass
+@dataclass(**SLOTS)
 class BaseOrder(OrderBase):
     """訂單狀態基礎類，繼承自 OrderBase，添加狀態相關字段
     
@@ -90,7 +91,7 @@ class BaseOrder(OrderBase):
     is_working: Optional[bool] = None
     orig_quote_order_qty: Optional[Decimal] = None
 
-@dataclass
+@dataclass(**SLOTS)
 class Order(OrderBase):
     """訂單類，繼承自 OrderBase，添加訂單相關字段
     
@@ -158,7 +159,7 @@ class Order(OrderBase):
     newOrderRespType: str = "RESULT"
     execution_type: Optional[str] = None
 
-@dataclass
+@dataclass(**SLOTS)
 class OrderResult:
     """訂單結果數據類
     
@@ -228,7 +229,7 @@ class OrderResult:
     prevented_quantity: Optional[Decimal] = None
     is_working: Optional[bool] = None
 
-@dataclass
+@dataclass(**SLOTS)
 class PositionInfo:
     """倉位信息數據類
     
@@ -275,7 +276,44 @@ class PositionInfo:
     ask_notional: Decimal
     update_time: int
 
-@dataclass
+@dataclass(**SLOTS)
+class AccountPosition:
+    """賬戶快照中的倉位數據類
+    
+    Attributes:
+        symbol: 交易對名稱
+        initial_margin: 初始保證金
+        maint_margin: 維持保證金
+        unrealized_profit: 未實現盈虧
+        position_initial_margin: 持倉初始保證金
+        open_order_initial_margin: 開單初始保證金
+        leverage: 槓桿倍數
+        isolated: 是否逐倉
+        entry_price: 開倉價格
+        max_notional: 最大名義價值
+        position_side: 倉位方向
+        position_amt: 持倉數量
+        notional: 名義價值
+        isolated_wallet: 逐倉錢包
+        update_time: 更新時間
+    """
+    symbol: str
+    initial_margin: Decimal
+    maint_margin: Decimal
+    unrealized_profit: Decimal
+    position_initial_margin: Decimal
+    open_order_initial_margin: Decimal
+    leverage: int
+    isolated: bool
+    entry_price: Decimal
+    max_notional: Decimal
+    position_side: str
+    position_amt: Decimal
+    notional: Decimal
+    isolated_wallet: Decimal
+    update_time: int
+
+@dataclass(**SLOTS)
 class AccountInfo:
     """賬戶信息數據類
     
@@ -307,5 +345,26 @@ class AccountInfo:
     total_maint_margin: Decimal
     total_cross_un_pnl: Decimal
     assets: List[AssetInfo]
-    positions: List[PositionInfo]
-    update_time: int 
\ No newline at end of file
+    positions: List[AccountPosition]
+    update_time: int
+
+@dataclass(frozen=True, **SLOTS)
+class SymbolConstraints:
+    """交易對交易規則數據類
+    
+    Attributes:
+        min_qty: 最小下單數量
+        max_qty: 最大下單數量
+        step_size: 數量步長
+        min_price: 最小價格
+        max_price: 最大價格
+        tick_size: 價格步長
+        min_notional: 最小名義價值
+    """
+    min_qty: Decimal
+    max_qty: Decimal
+    step_size: Decimal
+    min_price: Decimal
+    max_price: Decimal
+    tick_size: Decimal
+    min_notional: Decimal
@@ -1,17 +1,27 @@
+import sys
 from enum import Enum
 
-class OrderSide(Enum):
+if sys.version_info >= (3, 11):
+    from enum import StrEnum
+else:
+    class StrEnum(str, Enum):
+        """Python 3.11 以前的 StrEnum 替代，成員本身即為字串"""
+
+        def __str__(self) -> str:
+            return self.value
+
+class OrderSide(StrEnum):
     """訂單方向"""
     BUY = "BUY"
     SELL = "SELL"
 
-class PositionSide(Enum):
+class PositionSide(StrEnum):
     """倉位方向"""
     BOTH = "BOTH"
     LONG = "LONG"
     SHORT = "SHORT"
 
-class OrderType(Enum):
+class OrderType(StrEnum):
     """訂單類型"""
     MARKET = "MARKET"
     LIMIT = "LIMIT"
@@ -22,7 +32,7 @@ class OrderType(Enum):
     TRAILING_STOP_MARKET = "TRAILING_STOP_MARKET"
     LIQUIDATION = "LIQUIDATION"
 
-class TimeInForce(Enum):
+class TimeInForce(StrEnum):
     """訂單有效期"""
     GTC = "GTC"  # Good Till Cancel
     IOC = "IOC"  # Immediate or Cancel
@@ -31,7 +41,7 @@ class TimeInForce(Enum):
     POST_ONLY = "POST_ONLY"  # Post Only
     GTE_GTC = "GTE_GTC"  # Good Till Expired - Good Till Cancel
 
-class OrderStatus(Enum):
+class OrderStatus(StrEnum):
     """訂單狀態"""
     NEW = "NEW"
     PARTIALLY_FILLED = "PARTIALLY_FILLED"
@@ -42,14 +52,14 @@ class OrderStatus(Enum):
     NEW_INSURANCE = "NEW_INSURANCE"
     NEW_ADL = "NEW_ADL"
 
-class PositionStatus(Enum):
+class PositionStatus(StrEnum):
     """倉位狀態"""
     OPEN = "OPEN"
     CLOSED = "CLOSED"
     LIQUIDATING = "LIQUIDATING"
     LIQUIDATED = "LIQUIDATED"
 
-class CloseReason(Enum):
+class CloseReason(StrEnum):
     """平倉原因"""
     STOP_LOSS = "STOP_LOSS"
     TAKE_PROFIT = "TAKE_PROFIT"
@@ -58,12 +68,12 @@ class CloseReason(Enum):
     LIQUIDATION = "LIQUIDATION"
     OTHER = "OTHER"
 
-class WorkingType(Enum):
+class WorkingType(StrEnum):
     """價格類型"""
     MARK_PRICE = "MARK_PRICE"
     CONTRACT_PRICE = "CONTRACT_PRICE"
 
-class PriceMatch(Enum):
+class PriceMatch(StrEnum):
     """價格匹配模式"""
     NONE = "NONE"
     OPPONENT = "OPPONENT"
@@ -75,14 +85,14 @@ class PriceMatch(Enum):
     QUEUE_10 = "QUEUE_10"
     QUEUE_20 = "QUEUE_20"
 
-class SelfTradePreventionMode(Enum):
+class SelfTradePreventionMode(StrEnum):
     """自成交防護模式"""
     NONE = "NONE"
     EXPIRE_TAKER = "EXPIRE_TAKER"
     EXPIRE_MAKER = "EXPIRE_MAKER"
     EXPIRE_BOTH = "EXPIRE_BOTH"
 
-class NewOrderRespType(Enum):
+class NewOrderRespType(StrEnum):
     """新訂單響應類型"""
     ACK = "ACK"
     RESULT = "RESULT" 
\ No newline at end of file
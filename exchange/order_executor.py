@@ -1,6 +1,6 @@
 from binance.error import ClientError
 import logging
-from typing import Optional, List, Dict, Union, Any
+from typing import Optional, List, Dict, Union, Any, Sequence
 import time
 from decimal import Decimal, ROUND_DOWN
 from datetime import datetime
@@ -13,6 +13,12 @@ from utils.config import check_config_parameters
 
 logger = logging.getLogger(__name__)
 
+# 需要檢查價格的訂單類型
+_TYPES_NEED_PRICE = frozenset({OrderType.LIMIT, OrderType.STOP, OrderType.TAKE_PROFIT})
+
+# 需要檢查止損價格的訂單類型
+_TYPES_NEED_STOP_PRICE = frozenset({OrderType.STOP, OrderType.STOP_MARKET, OrderType.TAKE_PROFIT, OrderType.TAKE_PROFIT_MARKET})
+
 class OrderExecutor:
     """訂單執行器"""
     
@@ -45,7 +51,7 @@ class OrderExecutor:
             self.api.change_leverage(symbol=symbol, leverage=config['leverage'])
                 
         except Exception as e:
-            logger.error(f"設置交易配置失敗: {str(e)}")
+            logger.error("設置交易配置失敗: %s", e)
             raise
 
     def _build_order_params(self, order: Order) -> dict:
@@ -181,13 +187,13 @@ class OrderExecutor:
                 raise ValueError(f"訂單名義價值 {notional_value} USDT 小於最小要求 {min_notional} USDT")
         
         # 如果是限價單，檢查價格限制
-        if order.type in [OrderType.LIMIT, OrderType.STOP, OrderType.TAKE_PROFIT]:
+        if order.type in _TYPES_NEED_PRICE:
             if not order.price:
                 raise ValueError("限價單必須指定價格")
             self._check_price_limits(order.symbol, order.price)
             
         # 如果是止損單，檢查止損價格限制
-        if order.type in [OrderType.STOP, OrderType.STOP_MARKET, OrderType.TAKE_PROFIT, OrderType.TAKE_PROFIT_MARKET]:
+        if order.type in _TYPES_NEED_STOP_PRICE:
             if not order.stop_price:
                 raise ValueError("止損單必須指定止損價格")
             self._check_stop_price_limits(order.symbol, order.stop_price)
@@ -217,29 +223,29 @@ class OrderExecutor:
             Order: 調整後的訂單對象
         """
         try:
-            lot_size_info = self.api.get_lot_size_info(order.symbol)
-            price_info = self.api.get_price_filter_info(order.symbol)
+            step_size = self.api.get_lot_size_info(order.symbol)['step_size']
+            tick_size = self.api.get_price_filter_info(order.symbol)['tick_size']
 
             # 數量調整
             if order.quantity is not None:
-                order.quantity = self._adjust_to_step_or_tick_size(order.quantity, lot_size_info['step_size'])
+                order.quantity = self._adjust_to_step_or_tick_size(order.quantity, step_size)
 
             # 價格調整
             if order.price is not None:
-                order.price = self._adjust_to_step_or_tick_size(order.price, price_info['tick_size'])
+                order.price = self._adjust_to_step_or_tick_size(order.price, tick_size)
 
             # 止損價格調整
             if order.stop_price is not None:
-                order.stop_price = self._adjust_to_step_or_tick_size(order.stop_price, price_info['tick_size'])
+                order.stop_price = self._adjust_to_step_or_tick_size(order.stop_price, tick_size)
 
             # 移動止損價格調整
             if order.activate_price is not None:
-                order.activate_price = self._adjust_to_step_or_tick_size(order.activate_price, price_info['tick_size'])
+                order.activate_price = self._adjust_to_step_or_tick_size(order.activate_price, tick_size)
             
             return order
         
         except Exception as e:
-            logger.error(f"調整訂單精度失敗: {str(e)}")
+            logger.error("調整訂單精度失敗: %s", e)
             raise
 
     def open_position_market(self, order: Order) -> OrderResult:
@@ -292,7 +298,7 @@ class OrderExecutor:
             return BinanceConverter.to_order_result(order_info)
             
         except Exception as e:
-            logger.error(f"開市價倉位發生錯誤: {str(e)}")
+            logger.error("開市價倉位發生錯誤: %s", e)
             raise
 
     def open_position_take_profit(self, order: Order) -> OrderResult:
@@ -339,10 +345,10 @@ class OrderExecutor:
             return BinanceConverter.to_order_result(order_info)
             
         except ClientError as e:
-            logger.error(f"開止盈倉位失敗: {str(e)}")
+            logger.error("開止盈倉位失敗: %s", e)
             raise
         except Exception as e:
-            logger.error(f"開止盈倉位發生錯誤: {str(e)}")
+            logger.error("開止盈倉位發生錯誤: %s", e)
             raise
 
     def open_position_stop_loss(self, order: Order) -> OrderResult:
@@ -389,10 +395,10 @@ class OrderExecutor:
             return BinanceConverter.to_order_result(order_info)
             
         except ClientError as e:
-            logger.error(f"開止損倉位失敗: {str(e)}")
+            logger.error("開止損倉位失敗: %s", e)
             raise
         except Exception as e:
-            logger.error(f"開止損倉位發生錯誤: {str(e)}")
+            logger.error("開止損倉位發生錯誤: %s", e)
             raise
 
     def open_position_trailing(self, order: Order) -> OrderResult:
@@ -440,10 +446,10 @@ class OrderExecutor:
             return BinanceConverter.to_order_result(order_info)
             
         except ClientError as e:
-            logger.error(f"開追蹤止損倉位失敗: {str(e)}")
+            logger.error("開追蹤止損倉位失敗: %s", e)
             raise
         except Exception as e:
-            logger.error(f"開追蹤止損倉位發生錯誤: {str(e)}")
+            logger.error("開追蹤止損倉位發生錯誤: %s", e)
             raise
             
     def get_order_status(self, symbol: str, order_id: int) -> OrderResult:
@@ -459,9 +465,18 @@ class OrderExecutor:
         """取消訂單"""
         return self.api.cancel_order(symbol, order_id, client_order_id)
         
-    def cancel_all_orders(self, symbol: Optional[str] = None) -> List[Order]:
-        """取消所有訂單"""
-        return self.api.cancel_all_orders(symbol)
+    def cancel_batch_orders(self, symbol: str, order_ids: Optional[List[int]] = None,
+                           client_order_ids: Optional[List[str]] = None) -> List[Order]:
+        """批量取消訂單"""
+        return self.api.cancel_batch_orders(symbol, order_ids, client_order_ids)
+        
+    def cancel_orders_for_symbols(self, reqs: List[Dict]) -> List[Order]:
+        """按交易對分組批量取消多筆訂單"""
+        return self.api.cancel_orders_for_symbols(reqs)
+        
+    def cancel_all_orders(self, symbol: Optional[str] = None, return_cancelled: bool = True) -> Sequence[Order]:
+        """取消所有訂單，返回延遲轉換的訂單序列"""
+        return self.api.cancel_all_orders(symbol, return_cancelled)
         
     def close_position(self, symbol: str, max_retries: int = 5) -> OrderResult:
         """平倉"""
@@ -469,7 +484,7 @@ class OrderExecutor:
             # 獲取當前持倉信息
             position_info = self.api.get_position_risk(symbol)
             if not position_info or position_info.position_amt == 0:
-                logger.info(f"沒有找到 {symbol} 的持倉信息或持倉數量為0")
+                logger.info("沒有找到 %s 的持倉信息或持倉數量為0", symbol)
                 return None
                 
             # 構建平倉訂單
@@ -500,14 +515,14 @@ class OrderExecutor:
                     
                 except ClientError as e:
                     if attempt < max_retries - 1:
-                        logger.warning(f"平倉失敗，重試中... ({attempt + 1}/{max_retries})")
+                        logger.warning("平倉失敗，重試中... (%s/%s)", attempt + 1, max_retries)
                         time.sleep(30)
                     else:
-                        logger.error(f"平倉失敗: {str(e)}")
+                        logger.error("平倉失敗: %s", e)
                         raise
                     
         except Exception as e:
-            logger.error(f"平倉發生錯誤: {str(e)}")
+            logger.error("平倉發生錯誤: %s", e)
             raise
 
     def close_all_positions(self, symbol: Optional[str] = None) -> List[OrderResult]:
@@ -519,13 +534,13 @@ class OrderExecutor:
         try:
             if symbol:
                 # 檢查交易對是否在 symbol_list 中
-                if symbol not in self.api.symbol_list:
+                if symbol not in self.api.symbol_set:
                     raise ValueError(f"交易對 {symbol} 不在配置的 symbol_list 中")
                     
                 # 獲取指定交易對的持倉信息
                 position = self.api.get_position_risk(symbol)
                 if not position or position.position_amt == 0:
-                    logger.info(f"沒有找到 {symbol} 的持倉信息或持倉數量為0")
+                    logger.info("沒有找到 %s 的持倉信息或持倉數量為0", symbol)
                     return []
                     
                 # 構建平倉訂單
@@ -550,7 +565,7 @@ class OrderExecutor:
                 
                 # 使用轉換器構建訂單結果
                 result = BinanceConverter.to_order_result(order_info)
-                logger.info(f"平倉成功: {position.symbol}")
+                logger.info("平倉成功: %s", position.symbol)
                 return [result]
                 
             else:
@@ -586,16 +601,16 @@ class OrderExecutor:
                         # 使用轉換器構建訂單結果
                         result = BinanceConverter.to_order_result(order_info)
                         results.append(result)
-                        logger.info(f"平倉成功: {position.symbol}")
+                        logger.info("平倉成功: %s", position.symbol)
                         
                     except Exception as e:
-                        logger.error(f"平倉失敗 {symbol}: {str(e)}")
+                        logger.error("平倉失敗 %s: %s", symbol, e)
                         continue
                         
                 return results
                 
         except Exception as e:
-            logger.error(f"平掉所有倉位發生錯誤: {str(e)}")
+            logger.error("平掉所有倉位發生錯誤: %s", e)
             raise
 
     def get_position(self, symbol: str = None) -> Union[PositionInfo, List[PositionInfo], None]:
@@ -619,7 +634,7 @@ class OrderExecutor:
                 return positions if positions else None
                 
         except Exception as e:
-            logger.error(f"獲取倉位信息失敗: {str(e)}")
+            logger.error("獲取倉位信息失敗: %s", e)
             return None
             
     def get_account_info(self) -> AccountInfo:
@@ -633,7 +648,7 @@ class OrderExecutor:
             return account
             
         except Exception as e:
-            logger.error(f"獲取賬戶信息失敗: {str(e)}")
+            logger.error("獲取賬戶信息失敗: %s", e)
             raise
 
     def get_current_price(self, symbol: str) -> Decimal:
@@ -641,7 +656,7 @@ class OrderExecutor:
         try:
             return self.api.get_current_price(symbol)
         except Exception as e:
-            logger.error(f"獲取當前價格失敗: {str(e)}")
+            logger.error("獲取當前價格失敗: %s", e)
             raise
 
     def get_order_book(self, symbol: str, limit: int = 100) -> Dict:
@@ -657,7 +672,7 @@ class OrderExecutor:
         try:
             return self.api.get_order_book(symbol, limit)
         except Exception as e:
-            logger.error(f"獲取訂單簿失敗: {str(e)}")
+            logger.error("獲取訂單簿失敗: %s", e)
             raise
 
     def open_position_limit(self, order: Order) -> OrderResult:
@@ -683,5 +698,5 @@ class OrderExecutor:
             return BinanceConverter.to_order_result(order_info)
             
         except Exception as e:
-            logger.error(f"開限價倉位發生錯誤: {str(e)}")
+            logger.error("開限價倉位發生錯誤: %s", e)
             raise
@@ -0,0 +1,118 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+from decimal import Decimal, InvalidOperation
+
+from .enums import OrderType
+from .converter import to_decimal
+from ._compat import SLOTS
+
+@dataclass(frozen=True, **SLOTS)
+class OrderSpec:
+    """訂單類型的參數規格
+    
+    Attributes:
+        required: 下單時必須提供的參數
+        positive: 數值必須大於 0 的參數
+    """
+    required: Tuple[str, ...] = ()
+    positive: Tuple[str, ...] = ()
+
+# 各訂單類型的參數規格，未列出的類型沒有額外要求
+# 以訂單類型字串為鍵，與調用方傳入的 params['type']（order.type.value）一致；
+# 只列出 Binance 要求的參數，workingType、activationPrice 等可選參數由交易所提供預設值
+ORDER_SPECS: Dict[str, OrderSpec] = {
+    OrderType.LIMIT.value: OrderSpec(
+        required=('price', 'timeInForce'),
+        positive=('price',)
+    ),
+    OrderType.STOP.value: OrderSpec(
+        required=('price', 'stopPrice'),
+        positive=('price', 'stopPrice')
+    ),
+    OrderType.STOP_MARKET.value: OrderSpec(
+        required=('stopPrice',),
+        positive=('stopPrice',)
+    ),
+    OrderType.TAKE_PROFIT.value: OrderSpec(
+        required=('price', 'stopPrice'),
+        positive=('price', 'stopPrice')
+    ),
+    OrderType.TAKE_PROFIT_MARKET.value: OrderSpec(
+        required=('stopPrice',),
+        positive=('stopPrice',)
+    ),
+    OrderType.TRAILING_STOP_MARKET.value: OrderSpec(
+        required=('callbackRate',),
+        positive=('callbackRate',)
+    ),
+}
+
+_EMPTY_SPEC = OrderSpec()
+
+# 所有訂單類型共用、提供時（值不為 None）數值必須大於 0 的參數
+_COMMON_POSITIVE = ('quantity', 'activationPrice')
+
+# 下單參數的中文名稱，用於錯誤信息
+PARAM_NAMES = {
+    'quantity': '數量',
+    'price': '價格',
+    'stopPrice': '止損價格',
+    'timeInForce': '訂單有效期',
+    'activationPrice': '激活價格',
+    'callbackRate': '回調率',
+}
+
+def to_positive_decimal(value: Any) -> Optional[Decimal]:
+    """將參數轉換為 Decimal，若為空、無法解析或不大於 0 則返回 None"""
+    if not value:
+        return None
+    try:
+        if value.__class__ is Decimal:
+            decimal_value = value
+        elif value.__class__ is str:
+            # 負數無需解析即可排除
+            if value[0] == '-':
+                return None
+            decimal_value = to_decimal(value)
+        else:
+            decimal_value = to_decimal(str(value))
+        return decimal_value if decimal_value > 0 else None
+    except InvalidOperation:
+        return None
+
+def validate_order_params(params: Dict) -> None:
+    """檢查下單參數，數值參數會以字串形式回寫到 params
+    
+    Args:
+        params: 下單參數
+        
+    Raises:
+        ValueError: 參數缺失或數值不合法
+    """
+    # 檢查必要參數
+    for param in ('symbol', 'side', 'type'):
+        if param not in params:
+            raise ValueError(f"缺少必要參數: {param}")
+    
+    order_type = params['type']
+    
+    # 檢查 reduce_only 和 close_position
+    if 'reduceOnly' in params and 'closePosition' in params:
+        raise ValueError("不能同時設置 reduceOnly 和 closePosition")
+    
+    # 檢查數量相關參數
+    if 'closePosition' not in params and 'reduceOnly' not in params and 'quantity' not in params:
+        raise ValueError("必須指定數量或設置 closePosition 或 reduceOnly")
+    
+    # 按訂單類型查表檢查必要參數及其數值，值為 None 的參數視為未提供（連接器發送前會將其移除）
+    spec = ORDER_SPECS.get(order_type, _EMPTY_SPEC)
+    for param in spec.required:
+        if params.get(param) is None:
+            raise ValueError(f"{order_type} 訂單必須指定{PARAM_NAMES[param]}")
+    positive = spec.positive + tuple(param for param in _COMMON_POSITIVE if params.get(param) is not None)
+    for param in positive:
+        value = to_positive_decimal(params[param])
+        if value is None:
+            raise ValueError(f"{order_type} 訂單{PARAM_NAMES[param]}必須大於0")
+        # 以定點格式的字串回寫，保留原始精度且不會出現 1E+1 之類的科學記數法
+        params[param] = format(value, 'f')
@@ -0,0 +1,320 @@
+import pytest
+from decimal import Decimal
+from unittest.mock import MagicMock
+import time
+import queue
+import sys
+import os
+
+# 添加專案根目錄到 Python 路徑
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import exchange.binance_api as binance_api
+from exchange import BinanceAPI, BatchOrderError
+
+TEST_SYMBOLS = ['BTCUSDT', 'ETHUSDT']
+
+MOCK_CONFIG = {
+    'testnet': True,
+    'debug': False,
+    'base_endpoint': 'https://fapi.binance.com',
+    'testnet_rest_api_url': 'https://testnet.binancefuture.com',
+    'webSocket_base_endpoint': 'wss://fstream.binance.com',
+    'webSocket_base_endpoint_for_testnet': 'wss://stream.binancefuture.com',
+    'recv_window': 5000,
+    'BINANCE_API_KEY': 'key',
+    'BINANCE_API_SECRET': 'secret',
+    'BINANCE_TESTNET_API_KEY': 'key',
+    'BINANCE_TESTNET_API_SECRET': 'secret',
+    'ping_interval': 20,
+    'pong_timeout': 5,
+    'reconnect_attempts': 3,
+    'symbol_list': TEST_SYMBOLS,
+    'leverage': 5,
+}
+
+@pytest.fixture
+def api(monkeypatch):
+    """創建使用模擬 REST 客戶端的 BinanceAPI，不連接交易所"""
+    monkeypatch.setattr(binance_api, 'check_config_parameters', lambda params: {p: MOCK_CONFIG.get(p) for p in params})
+    monkeypatch.setattr(binance_api, 'UMFutures', MagicMock())
+    return BinanceAPI()
+
+def order_event(symbol: str, order_id: int, status: str, execution_type: str = 'NEW') -> dict:
+    """構建 ORDER_TRADE_UPDATE 推送"""
+    return {
+        'e': 'ORDER_TRADE_UPDATE',
+        'T': 1700000000000,
+        'o': {
+            's': symbol, 'c': f'client-{order_id}', 'S': 'BUY', 'o': 'LIMIT', 'f': 'GTC',
+            'q': '0.01', 'p': '50000', 'ap': '0', 'sp': '0', 'x': execution_type, 'X': status,
+            'i': order_id, 'l': '0', 'z': '0', 'wt': 'CONTRACT_PRICE', 'ot': 'LIMIT',
+            'ps': 'BOTH', 'R': False, 'cp': False, 'pm': 'NONE', 'stpm': 'NONE', 'gtd': 0,
+        }
+    }
+
+def cancelled_symbols(api: BinanceAPI) -> set:
+    """返回已發出撤單請求的交易對"""
+    return {call.kwargs['symbol'] for call in api.client.cancel_open_orders.call_args_list}
+
+def test_cancel_all_orders_after_order_placed_during_previous_cancel(api):
+    """測試撤單後才收到（或尚未處理）的新訂單推送不會讓交易對被跳過"""
+    api._ws_connected.set()
+    open_orders = {}
+    api.client.get_orders.side_effect = lambda symbol, **kwargs: open_orders.get(symbol, [])
+
+    # 第一次撤單時沒有掛單
+    assert len(api.cancel_all_orders()) == 0
+
+    # 撤單期間另一處下單，推送仍在隊列中尚未處理
+    api._msg_queue.put_nowait(order_event('BTCUSDT', 1, 'NEW'))
+    open_orders['BTCUSDT'] = [{'symbol': 'BTCUSDT', 'orderId': 1, 'status': 'NEW'}]
+    api.client.cancel_open_orders.reset_mock()
+
+    cancelled = api.cancel_all_orders()
+    assert len(cancelled) == 1
+    assert 'BTCUSDT' in cancelled_symbols(api)
+
+def test_cancel_all_orders_without_snapshot_always_cancels(api):
+    """測試不返回被取消訂單時，每個交易對都會發出撤單請求"""
+    api._ws_connected.set()
+    api.cancel_all_orders(return_cancelled=False)
+
+    # 推送已處理的情況同樣不能跳過
+    api._handle_user_message(order_event('ETHUSDT', 2, 'NEW'))
+    api.client.cancel_open_orders.reset_mock()
+
+    api.cancel_all_orders(return_cancelled=False)
+    assert cancelled_symbols(api) == set(TEST_SYMBOLS)
+
+def test_order_event_without_transaction_time_uses_milliseconds(api):
+    """測試推送缺少撮合時間時，訂單時間戳以毫秒計"""
+    received = []
+    api.order_callback = received.append
+    event = order_event('BTCUSDT', 3, 'NEW')
+    del event['T']
+
+    before = int(time.time() * 1000)
+    api._handle_user_message(event)
+    after = int(time.time() * 1000)
+
+    assert len(received) == 1
+    assert before <= received[0].timestamp <= after
+
+EXCHANGE_INFO = {
+    'symbols': [
+        {
+            'symbol': 'BTCUSDT',
+            'filters': [
+                {'filterType': 'LOT_SIZE', 'minQty': '0.001', 'maxQty': '1000', 'stepSize': '0.001'},
+                {'filterType': 'PRICE_FILTER', 'minPrice': '0.10', 'maxPrice': '1000000', 'tickSize': '0.10'},
+                {'filterType': 'MIN_NOTIONAL', 'notional': '100'},
+            ]
+        },
+        {
+            # 缺少 MIN_NOTIONAL 過濾器
+            'symbol': 'ETHUSDT',
+            'filters': [
+                {'filterType': 'LOT_SIZE', 'minQty': '0.01', 'maxQty': '10000', 'stepSize': '0.01'},
+                {'filterType': 'PRICE_FILTER', 'minPrice': '0.01', 'maxPrice': '100000', 'tickSize': '0.01'},
+            ]
+        },
+    ]
+}
+
+def test_symbol_rules_are_independent(api):
+    """測試缺少某個過濾器只影響依賴該過濾器的查詢"""
+    api.client.exchange_info.return_value = EXCHANGE_INFO
+
+    assert api.get_lot_size_info('ETHUSDT')['step_size'] == Decimal('0.01')
+    assert api.get_price_filter_info('ETHUSDT')['tick_size'] == Decimal('0.01')
+    with pytest.raises(ValueError, match="最小名義價值"):
+        api.get_min_notional('ETHUSDT')
+    # 查詢失敗後其他規則仍可使用
+    assert api.get_lot_size_info('ETHUSDT')['min_qty'] == Decimal('0.01')
+
+    constraints = api.get_symbol_constraints('BTCUSDT')
+    assert constraints.min_notional == Decimal('100')
+    assert constraints.tick_size == Decimal('0.10')
+
+def test_symbol_rule_results_are_copies(api):
+    """測試修改返回的過濾器及交易規則不會影響緩存"""
+    api.client.exchange_info.return_value = EXCHANGE_INFO
+
+    filters = api.get_symbol_filters('BTCUSDT')
+    filters['LOT_SIZE']['stepSize'] = '1'
+    del filters['PRICE_FILTER']
+    lot_size_info = api.get_lot_size_info('BTCUSDT')
+    lot_size_info['step_size'] = Decimal('1')
+
+    assert api.get_symbol_filters('BTCUSDT')['LOT_SIZE']['stepSize'] == '0.001'
+    assert 'PRICE_FILTER' in api.get_symbol_filters('BTCUSDT')
+    assert api.get_lot_size_info('BTCUSDT')['step_size'] == Decimal('0.001')
+
+def test_websocket_connect_timeout_independent_of_pong_timeout(api):
+    """測試 WebSocket 連接超時不使用心跳的 pong_timeout"""
+    assert binance_api.websocket.getdefaulttimeout() == binance_api._WS_CONNECT_TIMEOUT
+    assert api.websocket_ping_timeout == MOCK_CONFIG['pong_timeout']
+
+def query_response(order_id: int, status: str) -> dict:
+    """構建 query_order 返回的訂單數據"""
+    return {'symbol': 'BTCUSDT', 'orderId': order_id, 'clientOrderId': f'client-{order_id}', 'status': status}
+
+def test_order_status_cache_invalidated_by_order_event(api):
+    """測試收到訂單推送後緩存失效，下次查詢重新請求交易所"""
+    api._ws_connected.set()
+    api.client.query_order.return_value = query_response(1, 'NEW')
+
+    assert api.get_order_status('BTCUSDT', order_id=1).status == 'NEW'
+    assert api.get_order_status('BTCUSDT', order_id=1).status == 'NEW'
+    assert api.client.query_order.call_count == 1
+
+    api._handle_user_message(order_event('BTCUSDT', 1, 'FILLED', 'TRADE'))
+    api.client.query_order.return_value = query_response(1, 'FILLED')
+
+    assert api.get_order_status('BTCUSDT', order_id=1).status == 'FILLED'
+    assert api.client.query_order.call_count == 2
+
+def test_order_status_query_racing_order_event_not_stream_backed(api):
+    """測試查詢期間收到訂單推送時，結果只按有效期緩存"""
+    api._ws_connected.set()
+    api._order_status_ttl = 0
+
+    def query_order(**params):
+        # 請求返回前推送已到達，返回的結果可能已過時
+        api._handle_user_message(order_event('BTCUSDT', 2, 'FILLED', 'TRADE'))
+        return query_response(2, 'NEW')
+
+    api.client.query_order.side_effect = query_order
+    api.get_order_status('BTCUSDT', order_id=2)
+
+    api.client.query_order.side_effect = None
+    api.client.query_order.return_value = query_response(2, 'FILLED')
+    assert api.get_order_status('BTCUSDT', order_id=2).status == 'FILLED'
+    assert api.client.query_order.call_count == 2
+
+def test_order_status_cache_discarded_when_message_dropped(api):
+    """測試消息隊列已滿丟棄推送時，緩存的訂單狀態失效"""
+    api._ws_connected.set()
+    api._msg_queue = queue.Queue(maxsize=1)
+    api.client.query_order.return_value = query_response(3, 'NEW')
+    api.get_order_status('BTCUSDT', order_id=3)
+
+    # 隊列已滿，成交推送被丟棄
+    api._enqueue_message(order_event('ETHUSDT', 4, 'NEW'))
+    api._enqueue_message(order_event('BTCUSDT', 3, 'FILLED', 'TRADE'))
+    assert api._msg_queue.qsize() == 1
+
+    api.client.query_order.return_value = query_response(3, 'FILLED')
+    assert api.get_order_status('BTCUSDT', order_id=3).status == 'FILLED'
+    assert api.client.query_order.call_count == 2
+
+# 各訂單類型按 OrderExecutor 構建的參數下單：類型為字串，不指定價格類型，移動止損可不設激活價格
+ORDER_PARAMS = {
+    'MARKET': {},
+    'LIMIT': {'price': Decimal('50000'), 'timeInForce': 'GTC'},
+    'STOP': {'price': Decimal('49000'), 'stopPrice': Decimal('49500')},
+    'STOP_MARKET': {'stopPrice': Decimal('49500')},
+    'TAKE_PROFIT': {'price': Decimal('52000'), 'stopPrice': Decimal('51500')},
+    'TAKE_PROFIT_MARKET': {'stopPrice': Decimal('51500')},
+    'TRAILING_STOP_MARKET': {'activationPrice': None, 'callbackRate': Decimal('1')},
+}
+
+@pytest.mark.parametrize('order_type', list(ORDER_PARAMS))
+def test_new_order_each_type(api, order_type):
+    """測試每種訂單類型都能通過參數檢查並送出"""
+    api.client.new_order.return_value = {
+        'symbol': 'BTCUSDT', 'orderId': 10, 'status': 'NEW', 'type': order_type, 'side': 'BUY',
+    }
+    params = {'symbol': 'BTCUSDT', 'side': 'BUY', 'type': order_type, 'quantity': Decimal('0.01')}
+    params.update(ORDER_PARAMS[order_type])
+
+    result = api.new_order(**params)
+
+    assert result.order_id == 10
+    assert result.type == order_type
+    sent = api.client.new_order.call_args.kwargs
+    assert sent['type'] == order_type
+    assert sent['quantity'] == '0.01'
+    assert 'workingType' not in sent
+
+def batch_response(batchOrders):
+    """模擬批量下單接口，每筆訂單均成功"""
+    return [{'symbol': order['symbol'], 'orderId': 100 + i, 'status': 'NEW', 'type': order['type'], 'side': order['side']}
+            for i, order in enumerate(batchOrders)]
+
+def market_order(**extra) -> dict:
+    """構建市價單參數"""
+    params = {'symbol': 'BTCUSDT', 'side': 'BUY', 'type': 'MARKET', 'quantity': Decimal('0.01')}
+    params.update(extra)
+    return params
+
+@pytest.fixture
+def batch_api(api):
+    """啟用微批次下單的 BinanceAPI"""
+    api.enable_batch = True
+    api.client.new_batch_order.side_effect = batch_response
+    yield api
+    api._stop_batch_flusher()
+
+def test_batch_orders_sent_when_window_expires(batch_api):
+    """測試累積時間到期後發送未滿一批的訂單"""
+    batch_api.batch_window = 0.05
+    futures = [batch_api.new_order_batched(**market_order()) for _ in range(2)]
+
+    results = [future.result(timeout=2) for future in futures]
+    assert [result.order_id for result in results] == [100, 101]
+    batch_api.client.new_batch_order.assert_called_once()
+    assert len(batch_api.client.new_batch_order.call_args.kwargs['batchOrders']) == 2
+
+def test_full_batch_sent_without_waiting_for_window(batch_api):
+    """測試累積滿 5 筆時立即發送，不等待累積時間"""
+    batch_api.batch_window = 60
+    futures = [batch_api.new_order_batched(**market_order()) for _ in range(5)]
+
+    for future in futures:
+        future.result(timeout=2)
+    batch_api.client.new_batch_order.assert_called_once()
+    assert len(batch_api.client.new_batch_order.call_args.kwargs['batchOrders']) == 5
+
+def test_batch_partial_failure_maps_to_each_future(batch_api):
+    """測試批量下單中失敗的項目只令對應的 Future 拋出異常"""
+    batch_api.batch_window = 60
+    batch_api.client.new_batch_order.side_effect = lambda batchOrders: [
+        {'symbol': 'BTCUSDT', 'orderId': 1, 'status': 'NEW'},
+        {'code': -2019, 'msg': 'Margin is insufficient.'},
+        {'symbol': 'BTCUSDT', 'orderId': 3, 'status': 'NEW'},
+    ]
+    futures = [batch_api.new_order_batched(**market_order()) for _ in range(3)]
+    batch_api._flush_pending_orders()
+
+    assert futures[0].result(timeout=2).order_id == 1
+    with pytest.raises(BatchOrderError) as excinfo:
+        futures[1].result(timeout=2)
+    assert excinfo.value.error_code == -2019
+    assert excinfo.value.error_message == 'Margin is insufficient.'
+    assert excinfo.value.status_code is None
+    assert futures[2].result(timeout=2).order_id == 3
+
+def test_batch_order_params_stringified(batch_api):
+    """測試批量下單參數轉為字串，布爾值轉為小寫"""
+    batch_api.batch_window = 60
+    future = batch_api.new_order_batched(**market_order(reduceOnly=True, priceProtect=False))
+    batch_api._flush_pending_orders()
+    future.result(timeout=2)
+
+    sent = batch_api.client.new_batch_order.call_args.kwargs['batchOrders'][0]
+    assert sent['reduceOnly'] == 'true'
+    assert sent['priceProtect'] == 'false'
+    assert sent['quantity'] == '0.01'
+
+def test_close_sends_pending_batch_orders(batch_api):
+    """測試關閉連接時發送累積中的訂單，之後的批次下單直接失敗"""
+    batch_api.batch_window = 60
+    future = batch_api.new_order_batched(**market_order())
+
+    batch_api.close()
+    assert future.result(timeout=2).order_id == 100
+
+    with pytest.raises(RuntimeError):
+        batch_api.new_order_batched(**market_order()).result(timeout=2)
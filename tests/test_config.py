@@ -0,0 +1,95 @@
+import pytest
+from unittest.mock import MagicMock
+import sys
+import os
+
+# 添加專案根目錄到 Python 路徑
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import utils.config as config
+from utils.config import check_config_parameters, resolve_endpoint
+
+ENDPOINTS = ['https://fapi.binance.com', 'https://fapi1.binance.com']
+
+@pytest.fixture
+def ping(monkeypatch):
+    """模擬端點測速請求，並清空測速緩存"""
+    monkeypatch.setattr(config, '_endpoint_cache', {})
+    mock_get = MagicMock()
+    monkeypatch.setattr(config.requests, 'get', mock_get)
+    return mock_get
+
+def test_resolve_single_endpoint(ping):
+    """測試單個端點原樣返回，不進行測速"""
+    assert resolve_endpoint('https://fapi.binance.com') == 'https://fapi.binance.com'
+    ping.assert_not_called()
+
+def test_resolve_endpoint_list_probed_once(ping):
+    """測試端點列表只測速一次，之後沿用緩存結果"""
+    first = resolve_endpoint(ENDPOINTS)
+    assert first in ENDPOINTS
+    assert ping.call_count == len(ENDPOINTS)
+
+    assert resolve_endpoint(list(ENDPOINTS)) == first
+    assert ping.call_count == len(ENDPOINTS)
+
+def test_resolve_endpoint_all_unreachable(ping):
+    """測試所有端點均無法連接時返回第一個"""
+    ping.side_effect = ConnectionError("unreachable")
+    assert resolve_endpoint(ENDPOINTS) == ENDPOINTS[0]
+
+def test_resolve_empty_endpoint_list(ping):
+    """測試空端點列表拋出異常"""
+    with pytest.raises(ValueError):
+        resolve_endpoint([])
+
+SETTINGS = """
+trading:
+  leverage: 5
+  symbol_list:
+    - BTCUSDT
+    - ETHUSDT
+"""
+
+@pytest.fixture
+def config_dir(tmp_path, monkeypatch):
+    """創建臨時配置目錄，並清空配置緩存"""
+    (tmp_path / 'settings.yaml').write_text(SETTINGS, encoding='utf-8')
+    (tmp_path / 'api_keys.env').write_text("BINANCE_API_KEY=key-1\n", encoding='utf-8')
+    monkeypatch.setenv('CONFIG_DIR', str(tmp_path))
+    monkeypatch.delenv('BINANCE_API_KEY', raising=False)
+    monkeypatch.setattr(config, '_settings_cache', {})
+    monkeypatch.setattr(config, '_api_keys', {})
+    return tmp_path
+
+def test_config_values_not_shared_between_callers(config_dir):
+    """測試修改返回的配置不會影響之後的讀取結果"""
+    first = check_config_parameters(['symbol_list'])
+    first['symbol_list'].append('XRPUSDT')
+
+    second = check_config_parameters(['symbol_list'])
+    assert second['symbol_list'] == ['BTCUSDT', 'ETHUSDT']
+
+def test_api_keys_read_per_env_file(config_dir, tmp_path_factory, monkeypatch):
+    """測試不同配置目錄的金鑰分開讀取，後加載的文件不會被先加載的覆蓋"""
+    assert check_config_parameters(['BINANCE_API_KEY'])['BINANCE_API_KEY'] == 'key-1'
+
+    other_dir = tmp_path_factory.mktemp('other')
+    (other_dir / 'settings.yaml').write_text(SETTINGS, encoding='utf-8')
+    (other_dir / 'api_keys.env').write_text("BINANCE_API_KEY=key-2\n", encoding='utf-8')
+    monkeypatch.setenv('CONFIG_DIR', str(other_dir))
+    assert check_config_parameters(['BINANCE_API_KEY'])['BINANCE_API_KEY'] == 'key-2'
+
+    monkeypatch.setenv('CONFIG_DIR', str(config_dir))
+    assert check_config_parameters(['BINANCE_API_KEY'])['BINANCE_API_KEY'] == 'key-1'
+
+def test_api_keys_snapshot_until_restart(config_dir):
+    """測試金鑰只在首次讀取時載入，文件修改後沿用舊值直至重啟"""
+    assert check_config_parameters(['BINANCE_API_KEY'])['BINANCE_API_KEY'] == 'key-1'
+    (config_dir / 'api_keys.env').write_text("BINANCE_API_KEY=rotated\n", encoding='utf-8')
+    assert check_config_parameters(['BINANCE_API_KEY'])['BINANCE_API_KEY'] == 'key-1'
+
+def test_process_environment_overrides_env_file(config_dir, monkeypatch):
+    """測試進程環境變量中的金鑰優先於文件中的值"""
+    monkeypatch.setenv('BINANCE_API_KEY', 'from-environment')
+    assert check_config_parameters(['BINANCE_API_KEY'])['BINANCE_API_KEY'] == 'from-environment'
@@ -0,0 +1,32 @@
+from decimal import Decimal
+import sys
+import os
+
+# 添加專案根目錄到 Python 路徑
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from exchange.converter import BinanceConverter
+
+def test_position_numeric_fields_from_non_strings():
+    """測試倉位的浮點數及整數字段按字面值轉換，不帶二進制誤差"""
+    position = BinanceConverter.to_position({
+        'symbol': 'BTCUSDT', 'positionAmt': 0.1, 'entryPrice': 50000, 'markPrice': '50000.5',
+        'unRealizedProfit': 0.0, 'notional': 0,
+    })
+    assert position.position_amt == Decimal('0.1')
+    assert str(position.position_amt) == '0.1'
+    assert str(position.entry_price) == '50000'
+    assert str(position.un_realized_profit) == '0.0'
+    assert str(position.notional) == '0'
+
+def test_account_numeric_fields_from_non_strings():
+    """測試帳戶資產及倉位的浮點數字段按字面值轉換"""
+    account = BinanceConverter.to_account_info({
+        'totalWalletBalance': '100',
+        'assets': [{'asset': 'USDT', 'walletBalance': 0.1, 'availableBalance': Decimal('99.5')}],
+        'positions': [{'symbol': 'BTCUSDT', 'entryPrice': 0.3, 'positionAmt': 0}],
+    })
+    assert str(account.assets[0].wallet_balance) == '0.1'
+    assert account.assets[0].available_balance == Decimal('99.5')
+    assert str(account.positions[0].entry_price) == '0.3'
+    assert str(account.positions[0].position_amt) == '0'
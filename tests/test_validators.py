@@ -0,0 +1,95 @@
+import pytest
+from decimal import Decimal
+import sys
+import os
+
+# 添加專案根目錄到 Python 路徑
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from exchange.enums import OrderType
+from exchange.validators import validate_order_params
+
+def make_params(order_type: str, **extra) -> dict:
+    """構建基本下單參數"""
+    params = {'symbol': 'BTCUSDT', 'side': 'BUY', 'type': order_type, 'quantity': '0.01'}
+    params.update(extra)
+    return params
+
+def test_market_order():
+    """測試市價單只需數量"""
+    params = make_params('MARKET')
+    validate_order_params(params)
+    assert params['quantity'] == '0.01'
+
+def test_limit_order():
+    """測試限價單需要價格及訂單有效期"""
+    validate_order_params(make_params('LIMIT', price='50000', timeInForce='GTC'))
+
+    with pytest.raises(ValueError, match="價格"):
+        validate_order_params(make_params('LIMIT', timeInForce='GTC'))
+    with pytest.raises(ValueError, match="訂單有效期"):
+        validate_order_params(make_params('LIMIT', price='50000'))
+    with pytest.raises(ValueError, match="必須大於0"):
+        validate_order_params(make_params('LIMIT', price='0', timeInForce='GTC'))
+
+@pytest.mark.parametrize('order_type', ['STOP', 'TAKE_PROFIT'])
+def test_stop_limit_orders(order_type):
+    """測試止損/止盈限價單需要價格及觸發價格，價格類型可省略"""
+    validate_order_params(make_params(order_type, price='50000', stopPrice='49000'))
+
+    with pytest.raises(ValueError, match="止損價格"):
+        validate_order_params(make_params(order_type, price='50000'))
+    with pytest.raises(ValueError, match="價格"):
+        validate_order_params(make_params(order_type, stopPrice='49000'))
+
+@pytest.mark.parametrize('order_type', ['STOP_MARKET', 'TAKE_PROFIT_MARKET'])
+def test_stop_market_orders(order_type):
+    """測試止損/止盈市價單只需觸發價格，價格類型可省略"""
+    validate_order_params(make_params(order_type, stopPrice='49000'))
+
+    # 平倉單無需數量
+    params = {'symbol': 'BTCUSDT', 'side': 'SELL', 'type': order_type,
+              'stopPrice': '49000', 'closePosition': True}
+    validate_order_params(params)
+
+    with pytest.raises(ValueError, match="止損價格"):
+        validate_order_params(make_params(order_type))
+    with pytest.raises(ValueError, match="必須大於0"):
+        validate_order_params(make_params(order_type, stopPrice='-1'))
+
+def test_trailing_stop_market_order():
+    """測試移動止損單只需回調率，激活價格可省略"""
+    validate_order_params(make_params('TRAILING_STOP_MARKET', callbackRate=Decimal('1')))
+    validate_order_params(make_params('TRAILING_STOP_MARKET', callbackRate='1', activationPrice=None))
+
+    params = make_params('TRAILING_STOP_MARKET', callbackRate='1', activationPrice=Decimal('51000'))
+    validate_order_params(params)
+    assert params['activationPrice'] == '51000'
+
+    with pytest.raises(ValueError, match="回調率"):
+        validate_order_params(make_params('TRAILING_STOP_MARKET'))
+    with pytest.raises(ValueError, match="激活價格"):
+        validate_order_params(make_params('TRAILING_STOP_MARKET', callbackRate='1', activationPrice='0'))
+
+def test_enum_order_type():
+    """測試以枚舉成員傳入訂單類型時同樣適用規格"""
+    with pytest.raises(ValueError, match="價格"):
+        validate_order_params(make_params(OrderType.LIMIT, timeInForce='GTC'))
+
+def test_common_checks():
+    """測試通用參數檢查"""
+    with pytest.raises(ValueError, match="缺少必要參數"):
+        validate_order_params({'symbol': 'BTCUSDT', 'side': 'BUY'})
+    with pytest.raises(ValueError, match="reduceOnly 和 closePosition"):
+        validate_order_params(make_params('MARKET', reduceOnly=True, closePosition=True))
+    with pytest.raises(ValueError, match="必須指定數量"):
+        validate_order_params({'symbol': 'BTCUSDT', 'side': 'BUY', 'type': 'MARKET'})
+    with pytest.raises(ValueError, match="數量必須大於0"):
+        validate_order_params(make_params('MARKET', quantity='-0.01'))
+
+def test_values_written_as_plain_decimal_strings():
+    """測試數值以定點格式回寫，不會出現科學記數法"""
+    params = make_params('LIMIT', price=Decimal('1E+1'), timeInForce='GTC', quantity=Decimal('1E-7'))
+    validate_order_params(params)
+    assert params['price'] == '10'
+    assert params['quantity'] == '0.0000001'
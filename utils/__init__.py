@@ -1,5 +1,6 @@
-from .config import check_config_parameters
+from .config import check_config_parameters, resolve_endpoint
 
 __all__ = [
     'check_config_parameters',
+    'resolve_endpoint',
 ]
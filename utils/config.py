@@ -1,11 +1,128 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple, Union
 import yaml
 import os
-from dotenv import load_dotenv
+import copy
+import time
+import threading
+import requests
+from dotenv import dotenv_values
 import logging
 
+# 優先使用 libyaml 的 C 實現解析，未安裝時退回純 Python 實現
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 logger = logging.getLogger(__name__)
 
+# 已解析的設置文件緩存 {路徑: (修改時間, 配置)}
+_settings_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+# 從環境變量文件讀取的金鑰名稱
+_API_KEY_NAMES = (
+    'BINANCE_API_KEY',
+    'BINANCE_API_SECRET',
+    'BINANCE_TESTNET_API_KEY',
+    'BINANCE_TESTNET_API_SECRET',
+    'DISCORD_WEBHOOK_URL',
+)
+
+# 各環境變量文件讀取的 API 金鑰 {文件路徑: {金鑰名稱: 值}}
+# 每個文件只在首次使用時讀取一次，輪換金鑰後需重啟進程才會生效
+_api_keys: Dict[str, Dict[str, Any]] = {}
+
+# 已測速的 REST 端點緩存 {候選端點: 最快端點}，同一進程內只測一次
+_endpoint_cache: Dict[Tuple[str, ...], str] = {}
+_endpoint_lock = threading.Lock()
+
+def _select_fastest_endpoint(endpoints: Tuple[str, ...]) -> str:
+    """
+    測量各 REST 端點的延遲並返回最快的一個
+    
+    Args:
+        endpoints: 候選的 REST 基礎 URL
+        
+    Returns:
+        str: 延遲最低的端點，全部無法連接時返回第一個
+    """
+    latencies = {}
+    for endpoint in endpoints:
+        try:
+            start = time.perf_counter()
+            requests.get(f"{endpoint.rstrip('/')}/fapi/v1/ping", timeout=1).raise_for_status()
+            latencies[endpoint] = time.perf_counter() - start
+        except Exception as e:
+            logger.warning("測試端點 %s 延遲失敗: %s", endpoint, e)
+    if not latencies:
+        return endpoints[0]
+    fastest = min(latencies, key=latencies.get)
+    logger.info("選用延遲最低的 REST 端點: %s (%.1f ms)", fastest, latencies[fastest] * 1000)
+    return fastest
+
+def resolve_endpoint(endpoint: Union[str, List[str]]) -> str:
+    """
+    解析配置中的 REST 端點，配置為列表時選擇延遲最低的一個
+    
+    測速結果按候選列表緩存，之後創建的客戶端直接沿用，不會重複測速
+    
+    Args:
+        endpoint: 單個端點 URL，或候選端點 URL 列表
+        
+    Returns:
+        str: 要使用的端點 URL
+    """
+    if not isinstance(endpoint, (list, tuple)):
+        return endpoint
+    if not endpoint:
+        raise ValueError("REST 端點列表不能為空")
+        
+    key = tuple(endpoint)
+    with _endpoint_lock:
+        if key not in _endpoint_cache:
+            _endpoint_cache[key] = _select_fastest_endpoint(key)
+        return _endpoint_cache[key]
+
+def _load_env(env_path: str) -> Dict[str, Any]:
+    """
+    讀取環境變量文件中的 API 金鑰，每個文件只讀取一次
+    
+    進程環境變量中已設置的金鑰優先於文件中的值；不同文件的金鑰分開保存，互不覆蓋。
+    讀取結果在進程運行期間不會更新，輪換金鑰後需重啟進程
+    
+    Args:
+        env_path: 環境變量文件路徑
+        
+    Returns:
+        Dict[str, Any]: 金鑰名稱和對應的值，未設置時為 None
+    """
+    api_keys = _api_keys.get(env_path)
+    if api_keys is None:
+        file_values = dotenv_values(env_path)
+        api_keys = {name: os.environ.get(name, file_values.get(name)) for name in _API_KEY_NAMES}
+        _api_keys[env_path] = api_keys
+    return api_keys
+
+def _read_settings(config_path: str) -> Dict[str, Any]:
+    """
+    讀取設置文件，文件未修改時沿用上次解析的結果
+    
+    Args:
+        config_path: 設置文件路徑
+        
+    Returns:
+        Dict[str, Any]: 配置內容的副本，調用方修改不會影響緩存
+    """
+    mtime = os.stat(config_path).st_mtime
+    cached = _settings_cache.get(config_path)
+    if cached and cached[0] == mtime:
+        return copy.deepcopy(cached[1])
+        
+    with open(config_path, 'r', encoding='utf-8') as f:
+        config = yaml.load(f, Loader=_YamlLoader)
+    _settings_cache[config_path] = (mtime, config)
+    return copy.deepcopy(config)
+
 def check_config_parameters(required_params: List[str]) -> Dict[str, Any]:
     """
     檢查配置參數並返回參數值
@@ -16,8 +133,8 @@ def check_config_parameters(required_params: List[str]) -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: 參數名稱和對應的值，如果參數未設置則值為 None
     """
-    def _load_config() -> Dict[str, Any]:
-        """加載配置文件"""
+    def _load_config() -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """加載配置文件，返回設置內容及 API 金鑰"""
         try:
             # 獲取配置文件目錄
             config_dir = os.getenv('CONFIG_DIR')
@@ -41,33 +158,21 @@ def check_config_parameters(required_params: List[str]) -> Dict[str, Any]:
                 if not config_dir:
                     raise FileNotFoundError("找不到配置文件目錄")
                     
-            # 加載環境變量
+            # 讀取 API 金鑰
             env_path = os.path.join(config_dir, 'api_keys.env')
-            load_dotenv(dotenv_path=env_path)
+            api_keys = _load_env(env_path)
             
             # 加載設置文件
             config_path = os.path.join(config_dir, 'settings.yaml')
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
-                
-            return config
+            return _read_settings(config_path), api_keys
             
         except Exception as e:
-            logger.error(f"加載配置失敗: {str(e)}")
+            logger.error("加載配置失敗: %s", e)
             raise
 
     try:
-        # 加載配置
-        config = _load_config()
-        
-        # 加載 API 金鑰
-        api_keys = {
-            'BINANCE_API_KEY': os.getenv('BINANCE_API_KEY'),
-            'BINANCE_API_SECRET': os.getenv('BINANCE_API_SECRET'),
-            'BINANCE_TESTNET_API_KEY': os.getenv('BINANCE_TESTNET_API_KEY'),
-            'BINANCE_TESTNET_API_SECRET': os.getenv('BINANCE_TESTNET_API_SECRET'),
-            'DISCORD_WEBHOOK_URL': os.getenv('DISCORD_WEBHOOK_URL')
-        }
+        # 加載配置及當前配置目錄對應的 API 金鑰
+        config, api_keys = _load_config()
         
         # 初始化結果字典
         result = {}
@@ -113,5 +218,5 @@ def check_config_parameters(required_params: List[str]) -> Dict[str, Any]:
         return result
         
     except Exception as e:
-        logger.error(f"檢查配置參數失敗: {str(e)}")
+        logger.error("檢查配置參數失敗: %s", e)
         raise
\ No newline at end of file